@@ -5,6 +5,11 @@ import uuid
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Set
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class RemoMediaPlayerManager:
     """Playlist-authoritative media playback state manager.
@@ -49,6 +54,10 @@ class RemoMediaPlayerManager:
             self._save()
 
     def _save(self):
+        # Saved on every playback change, so prefer orjson when installed
+        if orjson is not None:
+            self.data_file.write_bytes(orjson.dumps(self.state, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            return
         with open(self.data_file, "w", encoding="utf-8") as f:
             json.dump(self.state, f, indent=2)
 
@@ -13,23 +13,43 @@ import shutil
 import socket
 import zipfile
 import tempfile
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 from pathlib import Path
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
 import platform
 import subprocess
 import secrets
+import threading
 import time
 import uuid
 import shlex
-from urllib.parse import quote_plus
-
-from fastapi import FastAPI, Request, HTTPException, Header, Depends, Body, WebSocket, WebSocketDisconnect, UploadFile, File, Form, BackgroundTasks
+import stat
+import struct
+import io
+import codecs
+import base64
+import hashlib
+import functools
+import heapq
+import collections
+import weakref
+from operator import itemgetter
+from urllib.parse import quote, urlsplit, urlunsplit
+
+from fastapi import FastAPI, Request, HTTPException, Header, Depends, Body, WebSocket, WebSocketDisconnect, UploadFile, File, Form
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import Response, JSONResponse, FileResponse, StreamingResponse
 from sse_starlette.sse import EventSourceResponse
+import aiofiles
 from pydantic import BaseModel
+try:
+    # pydantic v2: serializers compiled in pydantic-core
+    from pydantic import TypeAdapter
+except ImportError:
+    TypeAdapter = None
 import uvicorn
 
 from settings_manager import SettingsManager
@@ -51,6 +71,124 @@ try:
 except ImportError:
     CronTab = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# JSON helpers: orjson when installed, stdlib json otherwise
+_json_loads = orjson.loads if orjson else json.loads
+
+def _json_dumpb(obj, indent: bool = False) -> bytes:
+    """Serializes to UTF-8 JSON bytes (orjson when available)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when available (stdlib json otherwise)."""
+    def render(self, content: Any) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+def threadpool_endpoint(func):
+    """
+    Runs a blocking endpoint body (GitPython, subprocesses) in the threadpool.
+    The wrapper stays a coroutine function with the original signature, so
+    FastAPI and direct callers see no difference.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await run_in_threadpool(func, *args, **kwargs)
+    return wrapper
+
+# Per-repo write locks, keyed on the resolved path so symlinks and alternate
+# spellings of one repo share a lock. Weak values: a lock lives only while an
+# operation holds or waits on it, so the map can't grow with every path sent.
+_REPO_WRITE_LOCKS: "weakref.WeakValueDictionary[str, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+def serialize_repo(func):
+    """
+    Serializes a git write endpoint per repository (`req.path`). Waiters queue
+    on an asyncio.Lock instead of tying up a threadpool worker on the repo.
+    """
+    @functools.wraps(func)
+    async def wrapper(req, *args, **kwargs):
+        # Denied paths are rejected here, before any lock is created for them
+        key = str(check_path_access(req.path))
+        lock = _REPO_WRITE_LOCKS.get(key)
+        if lock is None:
+            lock = _REPO_WRITE_LOCKS[key] = asyncio.Lock()
+        async with lock:
+            return await func(req, *args, **kwargs)
+    return wrapper
+
+async def run_process(args: List[str], input: Optional[bytes] = None, cwd: Optional[str] = None, timeout: Optional[float] = None, limit: Optional[int] = None):
+    """
+    Runs a command without blocking the event loop; returns (returncode, stdout, stderr) as bytes.
+    On timeout the process is killed and asyncio.TimeoutError is raised.
+    With `limit`, each stream is captured up to that many bytes and the process
+    is killed as soon as either one overflows.
+    """
+    stdin = asyncio.subprocess.PIPE if input is not None else None
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            *args, stdin=stdin, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE, cwd=cwd
+        )
+    except NotImplementedError:
+        # Selector event loops (e.g. uvicorn --reload on Windows) cannot spawn
+        # subprocesses; fall back to a worker thread
+        def run():
+            p = subprocess.run(args, input=input, cwd=cwd, capture_output=True, timeout=timeout)
+            return p.returncode, p.stdout[:limit], p.stderr[:limit]
+        try:
+            return await asyncio.to_thread(run)
+        except subprocess.TimeoutExpired:
+            raise asyncio.TimeoutError()
+
+    def kill():
+        try:
+            proc.kill()
+        except ProcessLookupError: pass
+
+    async def drain(stream, buf: bytearray):
+        while True:
+            chunk = await stream.read(65536)
+            if not chunk:
+                return
+            room = limit - len(buf)
+            buf += chunk[:room]
+            if len(chunk) > room:
+                # Output cap reached; no point letting the command run on
+                kill()
+                return
+
+    async def capture():
+        if limit is None:
+            return await proc.communicate(input)
+        if input is not None:
+            proc.stdin.write(input)
+            await proc.stdin.drain()
+            proc.stdin.close()
+        out, err = bytearray(), bytearray()
+        await asyncio.gather(drain(proc.stdout, out), drain(proc.stderr, err))
+        await proc.wait()
+        return bytes(out), bytes(err)
+
+    try:
+        stdout, stderr = await asyncio.wait_for(capture(), timeout)
+    except asyncio.TimeoutError:
+        kill()
+        await proc.wait()
+        raise
+    return proc.returncode, stdout, stderr
+
 # --- Psutil Mock for Android/No-Dep environments ---
 if psutil is None:
     class MockPsutil:
@@ -106,7 +244,6 @@ if psutil is None:
 if platform.system() != "Windows":
     import pty
     import termios
-    import struct
     import fcntl
 
 # Global reference to the main event loop
@@ -115,99 +252,255 @@ REMODASH_TOKEN: Optional[str] = None
 
 # Short-lived session keys: {key: expiry_timestamp}
 SESSION_KEYS: Dict[str, float] = {}
+# (expiry, key) min-heap so expired keys are purged from the head only
+_SESSION_KEY_EXPIRY: List[tuple] = []
+
+def _purge_session_keys():
+    now = time.time()
+    while _SESSION_KEY_EXPIRY and _SESSION_KEY_EXPIRY[0][0] < now:
+        exp, k = heapq.heappop(_SESSION_KEY_EXPIRY)
+        if SESSION_KEYS.get(k) == exp:
+            del SESSION_KEYS[k]
 
 # --- DiskJournalLogger ---
+def _iso(ts) -> str:
+    """Formats an epoch-seconds event timestamp for clients; passes ISO strings through."""
+    if isinstance(ts, (int, float)):
+        return datetime.datetime.fromtimestamp(ts).isoformat()
+    return ts
+
 class DiskJournalLogger:
-    def __init__(self, log_dir="logs", lines_per_chunk=1000):
+    def __init__(self, log_dir="logs", chunk_bytes=8 * 1024 * 1024, batch_size=256, batch_window=0.001, subscriber_queue_size=1024):
         self.log_dir = Path(log_dir)
-        self.lines_per_chunk = lines_per_chunk
+        # Chunks rotate on size, not line count
+        self.chunk_bytes = chunk_bytes
         self.current_session_dir = None
         self.current_chunk_index = 0
-        self.current_chunk_lines = 0
         self.current_chunk_path = None
+        self._fd = None
+        self._bytes_written = 0
+        # Guards the chunk fd and rotation; writes happen on worker threads
+        self._write_lock = threading.Lock()
+
+        # Group commit: emit() queues events and a background flusher serializes
+        # and writes each batch with a single write() call in a worker thread
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self._queue: Optional[asyncio.Queue] = None
+        self._flusher = None
+        # Per-session event sequence; doubles as the SSE event id for replay
+        self._seq = 0
 
         # In-memory buffer for live streaming (tail)
-        self.subscribers = set()
-        self._lock = None
+        # Each subscriber is a (deque, Event) pair; the deque is bounded and
+        # evicts its oldest event on overflow, so emit never waits on a slow
+        # client. Evictions are counted in `drops`.
+        # Copy-on-write tuple: only mutated on the event loop, so emit reads it
+        # without any lock
+        self._subs: tuple = ()
+        self.subscriber_queue_size = subscriber_queue_size
+        self.drops = 0
 
         # Initialize session
         self._start_session()
 
-    @property
-    def lock(self):
-        if self._lock is None:
-            self._lock = asyncio.Lock()
-        return self._lock
-
     def _start_session(self):
         timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
         self.current_session_dir = self.log_dir / f"session_{timestamp}"
         self.current_session_dir.mkdir(parents=True, exist_ok=True)
-        self._start_new_chunk()
         print(f"[System] Logging to session: {self.current_session_dir}")
 
-    def _start_new_chunk(self):
+    def _open_chunk(self):
+        # Chunks are created lazily on first write, so idle sessions stay empty
         self.current_chunk_index += 1
         filename = f"chunk_{self.current_chunk_index:03d}.log"
         self.current_chunk_path = self.current_session_dir / filename
-        self.current_chunk_lines = 0
-        # Create empty file
-        with open(self.current_chunk_path, "w", encoding="utf-8") as f:
-            pass
+        self._bytes_written = 0
+        self._fd = os.open(self.current_chunk_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+    def _close_chunk(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def _write_batch(self, events: List[dict]):
+        """Serializes and appends a batch of events. Runs in a worker thread."""
+        try:
+            data = b"".join(_json_dumpb(e) + b"\n" for e in events)
+            with self._write_lock:
+                if self._fd is None:
+                    self._open_chunk()
+                view = memoryview(data)
+                while view:
+                    view = view[os.write(self._fd, view):]
+                self._bytes_written += len(data)
+                if self._bytes_written >= self.chunk_bytes:
+                    self._close_chunk()
+        except Exception as e:
+            print(f"Logging Failed: {e}")
+
+    def start(self):
+        """Starts the background flusher. Must be called from the running event loop."""
+        if self._flusher is None:
+            self._queue = asyncio.Queue()
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def stop(self):
+        """Flushes everything still queued, stops the flusher and closes the chunk file."""
+        if self._flusher:
+            self._queue.put_nowait(None)
+            await self._flusher
+            self._flusher = None
+            self._queue = None
+        with self._write_lock:
+            self._close_chunk()
+
+    async def flush(self):
+        """Waits until every event emitted so far has been written to disk."""
+        if self._queue is None:
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(waiter)
+        await waiter
+
+    async def _flush_loop(self):
+        # Queue items: event dicts, flush() waiters, or None to stop
+        done = False
+        while not done:
+            items = [await self._queue.get()]
+            # Short window so a burst of emits shares one write
+            await asyncio.sleep(self.batch_window)
+            while len(items) < self.batch_size and not self._queue.empty():
+                items.append(self._queue.get_nowait())
+
+            batch, waiters = [], []
+            for item in items:
+                if item is None:
+                    done = True
+                elif isinstance(item, asyncio.Future):
+                    waiters.append(item)
+                else:
+                    batch.append(item)
+            if batch:
+                await asyncio.to_thread(self._write_batch, batch)
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
 
     async def emit(self, level: str, msg: str, source: str = "System"):
+        self._seq += 1
         event = {
-            "ts": datetime.datetime.now().isoformat(),
+            "seq": self._seq,
+            # Epoch float; formatted lazily for clients by _iso()
+            "ts": time.time(),
             "level": level,
             "msg": msg,
             "source": source
         }
 
-        # 1. Write to Disk
-        try:
-            line = json.dumps(event) + "\n"
-            with open(self.current_chunk_path, "a", encoding="utf-8") as f:
-                f.write(line)
-
-            self.current_chunk_lines += 1
-            if self.current_chunk_lines >= self.lines_per_chunk:
-                self._start_new_chunk()
-
-        except Exception as e:
-            print(f"Logging Failed: {e}")
+        # 1. Write to Disk (batched by the flusher once it is running;
+        #    serialization and file I/O stay off the event loop either way)
+        if self._queue is not None:
+            self._queue.put_nowait(event)
+        else:
+            await asyncio.to_thread(self._write_batch, [event])
 
         # 2. Log to console
         print(f"[{level}] {source}: {msg}")
 
-        # 3. Notify subscribers (Live Stream)
-        async with self.lock:
-            for q in self.subscribers:
-                await q.put(event)
+        # 3. Notify subscribers (Live Stream) - non-blocking fan-out
+        for buf, wakeup in self._subs:
+            if len(buf) == buf.maxlen:
+                self.drops += 1
+            buf.append(event)
+            wakeup.set()
+
+    def _sse_event(self, event: dict) -> dict:
+        return {
+            "id": f"{self.current_session_dir.name}:{event['seq']}",
+            "data": _json_dumpb({**event, "ts": _iso(event["ts"])}).decode(),
+        }
+
+    def _replay_start(self, session_id: str, after_seq: int) -> List[Path]:
+        """Chunks of a session that may hold events after `after_seq`, oldest first."""
+        chunks = [self.log_dir / session_id / c["id"] for c in self.list_chunks(session_id)]
+        start = 0
+        for i, path in enumerate(chunks):
+            # Skip whole chunks whose first event is already behind the client
+            try:
+                with open(path, "rb") as f:
+                    first = _json_loads(f.readline())
+            except Exception:
+                continue
+            if first.get("seq", 0) <= after_seq + 1:
+                start = i
+            else:
+                break
+        return chunks[start:]
+
+    async def _replay(self, last_event_id: str):
+        """Streams events this session wrote after `last_event_id`, one line at a time."""
+        session_id = self.current_session_dir.name
+        last_session, _, last_seq = last_event_id.rpartition(":")
+        try:
+            after_seq = int(last_seq) if last_session == session_id else 0
+        except ValueError:
+            after_seq = 0
+
+        # Make sure everything emitted before this point is on disk
+        await self.flush()
+        for path in await asyncio.to_thread(self._replay_start, session_id, after_seq):
+            try:
+                async with aiofiles.open(path, "rb") as f:
+                    async for line in f:
+                        try:
+                            event = _json_loads(line)
+                        except Exception:
+                            continue
+                        if event.get("seq", 0) > after_seq:
+                            yield event
+            except FileNotFoundError:
+                continue
 
     async def subscribe(self, request: Request):
-        q = asyncio.Queue()
-        async with self.lock:
-            self.subscribers.add(q)
+        buf = collections.deque(maxlen=self.subscriber_queue_size)
+        wakeup = asyncio.Event()
+        sub = (buf, wakeup)
+        self._subs = self._subs + (sub,)
 
         try:
             # Yield initial connection message
             yield {
-                "data": json.dumps({'level':'Success', 'msg': 'Connected to Log Stream', 'ts': datetime.datetime.now().isoformat(), 'source': 'System'})
+                "data": _json_dumpb({'level':'Success', 'msg': 'Connected to Log Stream', 'ts': _iso(time.time()), 'source': 'System'}).decode()
             }
 
+            # Reconnecting clients catch up from disk; the queue is already
+            # subscribed, so anything replayed twice is skipped below
+            last_sent = 0
+            last_event_id = request.headers.get("last-event-id")
+            if last_event_id:
+                async for event in self._replay(last_event_id):
+                    last_sent = event["seq"]
+                    yield self._sse_event(event)
+
             while True:
                 if await request.is_disconnected():
                     break
 
-                try:
-                    event = await asyncio.wait_for(q.get(), timeout=15.0)
-                    yield {"data": json.dumps(event)}
-                except asyncio.TimeoutError:
-                    yield {"comment": "heartbeat"}
+                if not buf:
+                    try:
+                        await asyncio.wait_for(wakeup.wait(), timeout=15.0)
+                    except asyncio.TimeoutError:
+                        yield {"comment": "heartbeat"}
+                        continue
+                wakeup.clear()
+                while buf:
+                    event = buf.popleft()
+                    if event["seq"] <= last_sent:
+                        continue
+                    yield self._sse_event(event)
         finally:
-            async with self.lock:
-                if q in self.subscribers:
-                    self.subscribers.remove(q)
+            self._subs = tuple(x for x in self._subs if x is not sub)
 
     # --- Historical Access Methods ---
     def list_sessions(self):
@@ -234,22 +527,31 @@ class DiskJournalLogger:
             except: pass
         return sorted(chunks, key=lambda x: x["index"])
 
-    def get_chunk_content(self, session_id, chunk_id):
+    def chunk_path(self, session_id, chunk_id) -> Optional[Path]:
+        """Resolves a chunk file, refusing anything outside the log directory."""
+        names_ok = session_id.startswith("session_") and chunk_id.startswith("chunk_") and chunk_id.endswith(".log")
+        if not names_ok or any(sep in session_id + chunk_id for sep in ("/", "\\")):
+            return None
+        path = self.log_dir / session_id / chunk_id
+        return path if path.is_file() else None
+
+    async def get_chunk_content(self, session_id, chunk_id):
+        """Yields the events of a chunk one line at a time."""
         path = self.log_dir / session_id / chunk_id
         if not path.exists():
-            return []
+            return
 
-        lines = []
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                for line in f:
+            async with aiofiles.open(path, "rb") as f:
+                async for line in f:
                     if line.strip():
                         try:
-                            lines.append(json.loads(line))
-                        except: pass
+                            entry = _json_loads(line)
+                            entry["ts"] = _iso(entry.get("ts"))
+                        except: continue
+                        yield entry
         except Exception:
-            return []
-        return lines
+            return
 
 # --- Pydantic Models (Forward) ---
 class Shortcut(BaseModel):
@@ -263,54 +565,82 @@ class Shortcut(BaseModel):
     capture_output: bool = True
     run_mode: str = "output"
 
+# Serializer for the whole shortcuts list (pydantic v2); v1 falls back to a
+# plain field walk
+_shortcut_list_adapter = TypeAdapter(List[Shortcut]) if TypeAdapter else None
+_SHORTCUT_FIELDS = () if TypeAdapter else tuple(Shortcut.__fields__)
+
+def _dump_shortcuts(shortcuts) -> List[dict]:
+    if _shortcut_list_adapter is not None:
+        return _shortcut_list_adapter.dump_python(shortcuts)
+    return [{f: getattr(s, f) for f in _SHORTCUT_FIELDS} for s in shortcuts]
+
 class ShortcutRunRequest(BaseModel):
     run_mode: Optional[str] = None # Allow override
 
 # --- VLC Manager ---
+# Extensions picked up when building a VLC playlist from a folder
+VLC_MEDIA_EXTS = frozenset({'.mp4', '.mkv', '.avi', '.mov', '.mp3', '.flac', '.wav', '.webm', '.m4v'})
+
 class VLCManager:
-    def __init__(self, host="127.0.0.1", port=4212):
+    def __init__(self, host="127.0.0.1", port=4212, pid_file="data/vlc.pid"):
         self.host = host
         self.port = port
         self.process = None
+        # Survives server restarts so kill() can find VLC without a process scan
+        self.pid_file = Path(pid_file)
+        # RC connection kept open across commands; requests are pipelined
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def _read_reply(self) -> str:
+        """Reads one reply, up to VLC's "> " prompt."""
+        data = await asyncio.wait_for(self._reader.readuntil(b"> "), timeout=2)
+        return data[:-2].decode(errors="ignore").strip()
+
+    async def _connect(self):
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), timeout=2
+        )
+        # Swallow the welcome banner up to the first prompt
+        await self._read_reply()
 
-    def _send_command(self, cmd: str) -> str:
-        """Connects to VLC RC, sends command, returns response."""
-        try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(2)
-                s.connect((self.host, self.port))
-
-                # Receive initial welcome banner/prompt if any
-                try:
-                    s.recv(1024)
-                except: pass
-
-                # Send command
-                s.sendall(f"{cmd}\n".encode())
+    def _disconnect(self):
+        if self._writer:
+            try:
+                self._writer.close()
+            except Exception: pass
+        self._reader = self._writer = None
 
-                # Read response
-                # RC interface is tricky, it doesn't always signal end of message well.
-                # We read a bit.
-                data = b""
+    async def _send(self, *cmds: str) -> List[str]:
+        """Pipelines commands over the persistent RC connection, one reply per command."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            # Second attempt covers a kept-open connection that VLC has since closed
+            for attempt in range(2):
                 try:
-                    while True:
-                        chunk = s.recv(4096)
-                        if not chunk: break
-                        data += chunk
-                        if len(chunk) < 4096: break
-                except socket.timeout:
-                    pass
-
-                return data.decode(errors="ignore").strip()
-        except ConnectionRefusedError:
-            return "Error: VLC not running or RC interface not active."
-        except Exception as e:
-            return f"Error: {str(e)}"
+                    if self._writer is None:
+                        await self._connect()
+                    self._writer.write("".join(f"{cmd}\n" for cmd in cmds).encode())
+                    await self._writer.drain()
+                    return [await self._read_reply() for _ in cmds]
+                except ConnectionRefusedError:
+                    self._disconnect()
+                    return ["Error: VLC not running or RC interface not active."] * len(cmds)
+                except (ConnectionResetError, BrokenPipeError, asyncio.IncompleteReadError) as e:
+                    self._disconnect()
+                    if attempt:
+                        return [f"Error: {str(e)}"] * len(cmds)
+                except Exception as e:
+                    self._disconnect()
+                    return [f"Error: {str(e) or type(e).__name__}"] * len(cmds)
 
-    def launch(self, path: str):
+    async def launch(self, path: str):
         """Launches VLC with the specified playlist/folder."""
         # 1. Kill existing if running (simple single-instance management)
-        self.kill()
+        await self.kill()
 
         # 2. Build Playlist
         playlist_path = self._create_playlist(path)
@@ -346,6 +676,10 @@ class VLCManager:
                  env = os.environ.copy()
                  if "DISPLAY" not in env: env["DISPLAY"] = ":0"
                  self.process = subprocess.Popen(cmd, env=env, preexec_fn=os.setsid)
+            try:
+                self.pid_file.parent.mkdir(parents=True, exist_ok=True)
+                self.pid_file.write_text(str(self.process.pid))
+            except OSError: pass
         except FileNotFoundError:
              # Fallback logic could go here
              custom_vlc = settings_manager.settings.get("vlc_path")
@@ -353,18 +687,54 @@ class VLCManager:
                  raise Exception(f"VLC executable not found at configured path: {custom_vlc}")
              raise Exception("VLC executable not found. Please ensure VLC is installed and in your PATH, or configure the path in settings.")
 
-    def kill(self):
+    def _terminate_pid(self, pid: int) -> bool:
+        """Terminates VLC by pid (from the pidfile). Returns False if the pid is stale."""
+        try:
+            proc = psutil.Process(pid)
+            # The pid may have been reused by something else since VLC exited
+            if "vlc" not in proc.name().lower():
+                return False
+            proc.terminate()
+            try:
+                proc.wait(timeout=2)
+            except psutil.TimeoutExpired:
+                proc.kill()
+            return True
+        except Exception:
+            return False
+
+    async def kill(self, force: bool = False):
+        # The RC connection belongs to the loop; waiting for VLC to exit does not
+        self._disconnect()
+        await asyncio.to_thread(self._stop_process, force)
+
+    def _stop_process(self, force: bool = False):
+        """Terminates VLC and waits up to 2s per process. Blocking, run in a worker thread."""
+        stale = False
         # Kill python-tracked process
         if self.process:
             try:
                 self.process.terminate()
-                self.process = None
+                try:
+                    self.process.wait(timeout=2)
+                except subprocess.TimeoutExpired:
+                    self.process.kill()
             except: pass
+            self.process = None
+        else:
+            # Launched by a previous server run
+            try:
+                stale = not self._terminate_pid(int(self.pid_file.read_text().strip()))
+            except (OSError, ValueError):
+                pass
+        try:
+            self.pid_file.unlink()
+        except OSError: pass
 
-        # Force kill by port/name to be sure (in case launched externally or lost track)
-        # This is aggressive but requested: "start the vlc app... make new playlist" implies fresh start.
-        # We can use psutil to find process listening on port 4212?
-        # Or just pkill vlc.
+        # Kill by name only when we lost track of VLC (stale pidfile) or when
+        # asked to; walking every process is expensive
+        if not (force or stale):
+            return
         try:
             for proc in psutil.process_iter(['pid', 'name']):
                 try:
@@ -378,15 +748,16 @@ class VLCManager:
         p = Path(folder_path)
         if not p.exists(): return None
 
-        media_exts = {'.mp4', '.mkv', '.avi', '.mov', '.mp3', '.flac', '.wav', '.webm', '.m4v'}
         files = []
 
         if p.is_file():
-            files.append(p)
+            files.append(str(p))
         else:
-            for entry in p.iterdir():
-                if entry.is_file() and entry.suffix.lower() in media_exts:
-                    files.append(entry)
+            # DirEntry carries the file type, so no per-entry stat or Path objects
+            with os.scandir(p) as it:
+                for entry in it:
+                    if os.path.splitext(entry.name)[1].lower() in VLC_MEDIA_EXTS and entry.is_file():
+                        files.append(entry.path)
 
         if not files: return None
 
@@ -395,13 +766,11 @@ class VLCManager:
         os.close(fd)
 
         with open(temp_path, "w", encoding="utf-8") as f:
-            f.write("#EXTM3U\n")
-            for item in files:
-                f.write(f"{str(item)}\n")
+            f.write("#EXTM3U\n" + "\n".join(files) + "\n")
 
         return temp_path
 
-    def command(self, action: str):
+    async def command(self, action: str):
         # Map simple actions to RC commands
         valid = {
             "play": "play",
@@ -414,14 +783,13 @@ class VLCManager:
             "fullscreen": "f"
         }
         if action in valid:
-            return self._send_command(valid[action])
+            return (await self._send(valid[action]))[0]
         return "Invalid command"
 
-    def get_status(self):
+    async def get_status(self):
         # 'status' returns state (playing/stopped)
         # 'get_title' returns title
-        state = self._send_command("status")
-        title = self._send_command("get_title")
+        state, title = await self._send("status", "get_title")
 
         # Clean up output
         # VLC RC often echoes prompt "> "
@@ -433,65 +801,111 @@ class VLCManager:
 
 # --- Shortcuts Manager ---
 class ShortcutsManager:
-    def __init__(self, data_file="data/shortcuts.json"):
+    def __init__(self, data_file="data/shortcuts.json", save_delay=0.5):
         self.data_file = Path(data_file)
-        self.shortcuts = []
+        # Indexed by id; dict order keeps the user's insertion order
+        self._by_id: Dict[str, Shortcut] = {}
+        # Mutations mark the store dirty; a delayed flush coalesces bursts
+        # into one write off the event loop
+        self.save_delay = save_delay
+        self._dirty = False
+        self._save_handle: Optional[asyncio.TimerHandle] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._write_lock = threading.Lock()
         self._load()
 
+    @property
+    def shortcuts(self) -> List[Shortcut]:
+        return list(self._by_id.values())
+
     def _load(self):
         if not self.data_file.exists():
             # Create parent dir if needed
             try:
                 self.data_file.parent.mkdir(parents=True, exist_ok=True)
             except: pass
-            self.shortcuts = []
+            self._by_id = {}
             self._save()
             return
         try:
-            with open(self.data_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                self.shortcuts = [Shortcut(**s) for s in data.get("shortcuts", [])]
+            data = _json_loads(self.data_file.read_bytes())
+            self._by_id = {}
+            for item in data.get("shortcuts", []):
+                s = Shortcut(**item)
+                if not s.id:
+                    s.id = str(uuid.uuid4())
+                self._by_id[s.id] = s
         except Exception as e:
             print(f"Failed to load shortcuts: {e}")
-            self.shortcuts = []
+            self._by_id = {}
 
-    def _save(self):
+    def _write(self, data: dict):
+        """Writes atomically via a temp file. Safe to call from a worker thread."""
         try:
-            data = {"shortcuts": [s.dict() for s in self.shortcuts]}
-            with open(self.data_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            payload = _json_dumpb(data, indent=True)
+            tmp = self.data_file.with_name(self.data_file.name + ".tmp")
+            with self._write_lock:
+                tmp.write_bytes(payload)
+                os.replace(tmp, self.data_file)
         except Exception as e:
             print(f"Failed to save shortcuts: {e}")
 
+    def _snapshot(self) -> dict:
+        return {"shortcuts": _dump_shortcuts(list(self._by_id.values()))}
+
+    def _save(self):
+        """Schedules a coalesced save; writes immediately when no event loop is running."""
+        self._dirty = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._dirty = False
+            self._write(self._snapshot())
+            return
+        if self._save_handle is None:
+            self._save_handle = loop.call_later(self.save_delay, self._start_flush)
+
+    def _start_flush(self):
+        self._save_handle = None
+        self._flush_task = asyncio.create_task(self.flush())
+
+    async def flush(self):
+        """Writes pending changes now (also called on shutdown)."""
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+            self._save_handle = None
+        if not self._dirty:
+            return
+        self._dirty = False
+        await asyncio.to_thread(self._write, self._snapshot())
+
     def list(self):
         return self.shortcuts
 
     def get(self, sid):
-        for s in self.shortcuts:
-            if s.id == sid:
-                return s
-        return None
+        return self._by_id.get(sid)
 
     def add(self, s: Shortcut):
         # Generate ID if missing
         if not s.id:
             s.id = str(uuid.uuid4())
-        self.shortcuts.append(s)
+        self._by_id[s.id] = s
         self._save()
         return s
 
     def update(self, sid, updates: Dict[str, Any]):
-        for i, s in enumerate(self.shortcuts):
-            if s.id == sid:
-                updated = s.copy(update=updates)
-                self.shortcuts[i] = updated
-                self._save()
-                return updated
-        return None
+        s = self._by_id.get(sid)
+        if s is None:
+            return None
+        # Id stays fixed so the entry keeps its position
+        updated = s.copy(update={**updates, "id": sid})
+        self._by_id[sid] = updated
+        self._save()
+        return updated
 
     def delete(self, sid):
-        self.shortcuts = [s for s in self.shortcuts if s.id != sid]
-        self._save()
+        if self._by_id.pop(sid, None) is not None:
+            self._save()
 
 # --- Git Credentials Manager ---
 class GitCredentialsManager:
@@ -506,15 +920,13 @@ class GitCredentialsManager:
         if not self.data_file.exists():
             return {}
         try:
-            with open(self.data_file, "r", encoding="utf-8") as f:
-                return json.load(f)
+            return _json_loads(self.data_file.read_bytes())
         except Exception:
             return {}
 
     def save(self, data: Dict[str, str]):
         try:
-            with open(self.data_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            self.data_file.write_bytes(_json_dumpb(data, indent=True))
             # Try to set permissions to 600
             try:
                 os.chmod(self.data_file, 0o600)
@@ -768,11 +1180,19 @@ async def lifespan(app: FastAPI):
         except Exception as e:
             print(f"[System] Failed to set git safe.directory: {e}")
 
+    logger.start()
     await logger.emit("Info", "RemoDash Server started.", "System")
 
+    # Warm the sysinfo probe (DNS, wmic) in the background
+    _sysinfo_static_task()
+
     yield
 
-app = FastAPI(title="RemoDash Server", lifespan=lifespan)
+    await shortcuts_manager.flush()
+    await asyncio.to_thread(settings_manager.flush)
+    await logger.stop()
+
+app = FastAPI(title="RemoDash Server", lifespan=lifespan, default_response_class=FastJSONResponse)
 
 # Load Modules
 module_manager.load_modules(app)
@@ -799,6 +1219,23 @@ for d in defaults:
 
 print(f"[System] Allowed Origins: {allowed_origins}")
 
+class SelectiveGZipMiddleware(GZipMiddleware):
+    """GZip for API/static responses, except raw file views and the SSE log stream."""
+    # Older Starlette (the Android pin) buffers text/event-stream in the gzip
+    # compressor, so SSE is skipped by path rather than left to the responder
+    skip_paths = {"/api/files/view", "/api/logs"}
+    # Raw log chunks are served with Range support; keep byte offsets intact
+    skip_suffixes = ("/raw",)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and (scope["path"] in self.skip_paths or scope["path"].endswith(self.skip_suffixes)):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+# Large file contents and directory listings compress well over WAN links
+app.add_middleware(SelectiveGZipMiddleware, minimum_size=1024, compresslevel=6)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
@@ -809,28 +1246,52 @@ app.add_middleware(
 
 # --- Routes ---
 
-async def verify_token(x_token: Optional[str] = Header(None, alias="X-Token"), token: Optional[str] = None, key: Optional[str] = None):
+# The no_auth flag is toggled from outside (toggle_auth.py); re-stat at most once a second
+_NO_AUTH_CACHE = [float("-inf"), False]
+
+def _no_auth_enabled() -> bool:
+    now = time.monotonic()
+    if now - _NO_AUTH_CACHE[0] > 1.0:
+        _NO_AUTH_CACHE[0] = now
+        _NO_AUTH_CACHE[1] = Path("global_flags/no_auth").exists()
+    return _NO_AUTH_CACHE[1]
+
+def _token_matches(candidate: Optional[str]) -> bool:
+    """Constant-time comparison against the server token."""
+    if not REMODASH_TOKEN or not candidate:
+        return False
+    return secrets.compare_digest(candidate.encode(), REMODASH_TOKEN.encode())
+
+def _authenticate(token: Optional[str], key: Optional[str]) -> Optional[str]:
+    """
+    Shared by HTTP routes and websockets. Returns "NO_AUTH", "SESSION_KEY_VALID"
+    or the matching token, or None when the credentials are rejected.
+    """
     # Check for No Auth Flag
-    if Path("global_flags/no_auth").exists():
+    if _no_auth_enabled():
         return "NO_AUTH"
 
     # 1. Check Session Key (Preferred for WS/SSE)
     if key:
+        _purge_session_keys()
         expiry = SESSION_KEYS.get(key)
         if expiry and time.time() < expiry:
             return "SESSION_KEY_VALID"
         # If invalid/expired, fall through to token check
 
     # 2. Check Standard Token
+    return token if _token_matches(token) else None
+
+async def verify_token(x_token: Optional[str] = Header(None, alias="X-Token"), token: Optional[str] = None, key: Optional[str] = None):
     # Support both Header (preferred) and Query Param (SSE/EventSource)
-    auth_token = x_token or token
-    if not REMODASH_TOKEN or not auth_token or auth_token != REMODASH_TOKEN:
+    result = _authenticate(x_token or token, key)
+    if result is None:
         raise HTTPException(status_code=401, detail="Invalid or missing token")
-    return auth_token
+    return result
 
 @app.get("/api/auth/status")
 async def get_auth_status():
-    if Path("global_flags/no_auth").exists():
+    if _no_auth_enabled():
         return {"required": False}
     return {"required": True}
 
@@ -842,21 +1303,58 @@ async def verify_token_endpoint():
 async def create_session_token():
     """Generates a short-lived session token."""
     key = secrets.token_urlsafe(32)
-    # Valid for 60 seconds
-    SESSION_KEYS[key] = time.time() + 60
-
     # Lazy cleanup of expired keys
-    expired = [k for k, exp in SESSION_KEYS.items() if time.time() > exp]
-    for k in expired:
-        del SESSION_KEYS[k]
+    _purge_session_keys()
+
+    # Valid for 60 seconds
+    expiry = time.time() + 60
+    SESSION_KEYS[key] = expiry
+    heapq.heappush(_SESSION_KEY_EXPIRY, (expiry, key))
 
     return {"key": key}
 
-@app.get("/health")
-async def health_check():
+# Invariant for the process lifetime; platform.processor() can shell out
+_OS_INFO = {
+    "system": platform.system(),
+    "release": platform.release(),
+    "version": platform.version(),
+    "machine": platform.machine(),
+    "processor": platform.processor(),
+    "node": platform.node()
+}
+_CPU_COUNTS = (psutil.cpu_count(logical=True) or 1, psutil.cpu_count(logical=False) or 1)
+
+# Partition layout rarely changes; usage is still read per request
+_PARTITIONS_TTL = 30.0
+_partitions_cache = (float("-inf"), [])
+
+def _disk_partitions():
+    global _partitions_cache
+    ts, parts = _partitions_cache
+    now = time.monotonic()
+    if now - ts >= _PARTITIONS_TTL:
+        parts = psutil.disk_partitions()
+        _partitions_cache = (now, parts)
+    return parts
+
+# Concurrent polls share one CPU sample; back-to-back samples are just noise
+_CPU_SAMPLE_TTL = 0.5
+_cpu_sample = (float("-inf"), 0)
+
+def _cpu_percent():
+    global _cpu_sample
+    ts, value = _cpu_sample
+    now = time.monotonic()
+    if now - ts >= _CPU_SAMPLE_TTL:
+        value = psutil.cpu_percent(interval=None)
+        _cpu_sample = (now, value)
+    return value
+
+def _gather_health() -> dict:
+    """Collects all /health stats. Blocking; runs in a worker thread."""
     # Wrap psutil calls for Android/PermissionError compatibility
     try:
-        cpu_percent = psutil.cpu_percent()
+        cpu_percent = _cpu_percent()
     except (PermissionError, Exception):
         cpu_percent = 0
 
@@ -883,7 +1381,7 @@ async def health_check():
     # Detailed Partitions (New)
     partitions_info = []
     try:
-        for part in psutil.disk_partitions():
+        for part in _disk_partitions():
             try:
                 # Skip inaccessible partitions
                 if "cdrom" in part.opts or part.fstype == "":
@@ -907,8 +1405,8 @@ async def health_check():
     # CPU Info
     cpu_info = {
         "percent": cpu_percent,
-        "count_logical": psutil.cpu_count(logical=True) or 1,
-        "count_physical": psutil.cpu_count(logical=False) or 1,
+        "count_logical": _CPU_COUNTS[0],
+        "count_physical": _CPU_COUNTS[1],
         "freq_current": 0,
         "freq_max": 0
     }
@@ -953,14 +1451,7 @@ async def health_check():
     except: pass
 
     # OS Info
-    os_info = {
-        "system": platform.system(),
-        "release": platform.release(),
-        "version": platform.version(),
-        "machine": platform.machine(),
-        "processor": platform.processor(),
-        "node": platform.node()
-    }
+    os_info = _OS_INFO
 
     # Net IO
     net_io = {}
@@ -990,16 +1481,26 @@ async def health_check():
         "gpu": gpu_stats,
         "battery": battery_info,
         "os": os_info,
-        "net": net_io
+        "net": net_io,
+        "logs": {
+            "subscribers": len(logger._subs),
+            "dropped_events": logger.drops
+        }
     }
 
+@app.get("/health")
+async def health_check():
+    # One thread hop for all of the psutil/NVML syscalls
+    return await asyncio.to_thread(_gather_health)
+
 # --- Power Endpoints ---
 @app.post("/api/power/restart", dependencies=[Depends(verify_token)])
 async def restart_server():
     """Restarts the RemoDash server process."""
-    import threading
     def restart():
         time.sleep(1)
+        # os._exit skips atexit, so write out any pending settings first
+        settings_manager.flush()
         if platform.system() == "Windows":
             subprocess.Popen(["start", "cmd", "/c", f"{sys.executable} server.py"], shell=True)
         else:
@@ -1012,100 +1513,107 @@ async def restart_server():
 async def reboot_system():
     """Reboots the host machine."""
     try:
+        # Fire-and-forget so the response goes out before the OS starts going down
         if platform.system() == "Windows":
-            subprocess.run(["shutdown", "/r", "/t", "0"])
+            subprocess.Popen(["shutdown", "/r", "/t", "0"], close_fds=True, creationflags=subprocess.DETACHED_PROCESS)
         else:
-            subprocess.run(["sudo", "reboot"])
+            subprocess.Popen(["sudo", "reboot"], start_new_session=True)
         return {"success": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/git/stash", dependencies=[Depends(verify_token)])
-async def git_stash(req: GitRepoRequest):
+@serialize_repo
+@threadpool_endpoint
+def git_stash(req: GitRepoRequest):
     check_path_access(req.path) # Validate Access
     if not git: raise HTTPException(status_code=501)
     try:
-        r = git.Repo(req.path)
-        try: _ = r.head.commit
-        except ValueError: raise Exception("Cannot stash: No commits yet")
+        with _open_repo(req.path) as r:
+            try: _ = r.head.commit
+            except ValueError: raise Exception("Cannot stash: No commits yet")
 
-        r.git.stash('save', req.message or f"Stash from RemoDash {datetime.datetime.now()}")
-        return {"success": True}
+            r.git.stash('save', req.message or f"Stash from RemoDash {datetime.datetime.now()}")
+            return {"success": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/git/stash/pop", dependencies=[Depends(verify_token)])
-async def git_stash_pop(req: GitRepoRequest):
+@serialize_repo
+@threadpool_endpoint
+def git_stash_pop(req: GitRepoRequest):
     check_path_access(req.path) # Validate Access
     if not git: raise HTTPException(status_code=501)
     try:
-        r = git.Repo(req.path)
-        r.git.stash('pop')
-        return {"success": True}
+        with _open_repo(req.path) as r:
+            r.git.stash('pop')
+            return {"success": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/git/discard", dependencies=[Depends(verify_token)])
-async def git_discard(req: GitRepoRequest):
+@serialize_repo
+@threadpool_endpoint
+def git_discard(req: GitRepoRequest):
     check_path_access(req.path) # Validate Access
     if not git: raise HTTPException(status_code=501)
     try:
-        r = git.Repo(req.path)
+        with _open_repo(req.path) as r:
 
-        has_commits = True
-        try: _ = r.head.commit
-        except ValueError: has_commits = False
+            has_commits = True
+            try: _ = r.head.commit
+            except ValueError: has_commits = False
 
-        if req.files and len(req.files) > 0:
-            # Discard specific files
-            untracked = set(r.untracked_files)
+            if req.files and len(req.files) > 0:
+                # Discard specific files
+                untracked = set(r.untracked_files)
 
-            for f in req.files:
-                fp = os.path.join(req.path, f)
-                if f in untracked:
-                     if os.path.exists(fp):
-                         try:
-                            if os.path.isdir(fp): shutil.rmtree(fp)
-                            else: os.remove(fp)
-                         except: pass
-                else:
-                    if has_commits:
-                        r.git.checkout('HEAD', '--', f)
+                for f in req.files:
+                    fp = os.path.join(req.path, f)
+                    if f in untracked:
+                         if os.path.exists(fp):
+                             try:
+                                if os.path.isdir(fp): shutil.rmtree(fp)
+                                else: os.remove(fp)
+                             except: pass
                     else:
-                        # No commits: unstage and delete
-                        try:
-                            r.git.rm('--cached', f)
-                            if os.path.exists(fp): os.remove(fp)
-                        except: pass
-        else:
-            # Discard all
-            if has_commits:
-                r.git.reset('--hard', 'HEAD')
+                        if has_commits:
+                            r.git.checkout('HEAD', '--', f)
+                        else:
+                            # No commits: unstage and delete
+                            try:
+                                r.git.rm('--cached', f)
+                                if os.path.exists(fp): os.remove(fp)
+                            except: pass
             else:
-                # No commits: Unstage all
-                try: r.git.rm('-r', '--cached', '.', ignore_unmatch=True)
-                except: pass
+                # Discard all
+                if has_commits:
+                    r.git.reset('--hard', 'HEAD')
+                else:
+                    # No commits: Unstage all
+                    try: r.git.rm('-r', '--cached', '.', ignore_unmatch=True)
+                    except: pass
 
-            r.git.clean('-fd') # Clean untracked
+                r.git.clean('-fd') # Clean untracked
 
-        return {"success": True}
+            return {"success": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/power/shutdown", dependencies=[Depends(verify_token)])
 async def shutdown_system():
     """Shuts down the RemoDash server process."""
-    import threading
     def shutdown():
         time.sleep(1)
+        # os._exit skips atexit, so write out any pending settings first
+        settings_manager.flush()
         os._exit(0)
     threading.Thread(target=shutdown).start()
     return {"success": True}
 
 # --- Task Manager Endpoints ---
-@app.get("/api/tasks", dependencies=[Depends(verify_token)])
-async def get_tasks():
-    processes = []
+def _iter_process_info():
+    """Yields psutil info dicts for the task manager. Blocking; run in a worker thread."""
     try:
         # 'username' often causes PermissionError on Android
         attrs = ['pid', 'name', 'cpu_percent', 'memory_percent', 'status']
@@ -1117,11 +1625,44 @@ async def get_tasks():
                 p_info = proc.info
                 # Polyfill username if missing
                 if 'username' not in p_info: p_info['username'] = "?"
-                processes.append(p_info)
+                yield p_info
             except (psutil.NoSuchProcess, psutil.AccessDenied):
                 pass
     except Exception: pass
-    return processes
+
+@app.get("/api/tasks", dependencies=[Depends(verify_token)])
+async def get_tasks():
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+
+    def produce():
+        # Walks the process table off the loop and hands over serialized batches
+        batch = []
+        try:
+            for p_info in _iter_process_info():
+                batch.append(_json_dumpb(p_info))
+                if len(batch) >= 64:
+                    loop.call_soon_threadsafe(queue.put_nowait, b",".join(batch))
+                    batch = []
+            if batch:
+                loop.call_soon_threadsafe(queue.put_nowait, b",".join(batch))
+        finally:
+            loop.call_soon_threadsafe(queue.put_nowait, None)
+
+    async def body():
+        producer = asyncio.ensure_future(asyncio.to_thread(produce))
+        yield b"["
+        sep = b""
+        while True:
+            chunk = await queue.get()
+            if chunk is None:
+                break
+            yield sep + chunk
+            sep = b","
+        yield b"]"
+        await producer
+
+    return StreamingResponse(body(), media_type="application/json")
 
 @app.post("/api/tasks/kill", dependencies=[Depends(verify_token)])
 async def kill_task(req: TaskKillRequest):
@@ -1159,16 +1700,25 @@ async def get_cron():
 
 @app.post("/api/cron", dependencies=[Depends(verify_token)])
 async def save_cron(req: CronRequest):
+    tmp_path = None
     try:
-        proc = subprocess.Popen(['crontab', '-'], stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        stdout, stderr = proc.communicate(input=req.lines.encode('utf-8'))
+        # Install from a file rather than piping stdin; crontab needs a final newline
+        with tempfile.NamedTemporaryFile("w", suffix=".cron", delete=False, encoding="utf-8") as tmp:
+            tmp.write(req.lines if req.lines.endswith("\n") else req.lines + "\n")
+            tmp_path = tmp.name
+
+        returncode, stdout, stderr = await run_process(['crontab', tmp_path])
 
-        if proc.returncode != 0:
+        if returncode != 0:
              raise Exception(stderr.decode())
 
         return {"success": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        if tmp_path:
+            try: os.unlink(tmp_path)
+            except OSError: pass
 
 # --- VLC Endpoints ---
 
@@ -1177,7 +1727,7 @@ async def vlc_launch(req: VLCLaunchRequest):
     try:
         # Validate path access using existing check
         check_path_access(req.path)
-        vlc_manager.launch(req.path)
+        await vlc_manager.launch(req.path)
         return {"success": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1185,7 +1735,7 @@ async def vlc_launch(req: VLCLaunchRequest):
 @app.post("/api/vlc/command", dependencies=[Depends(verify_token)])
 async def vlc_command(req: VLCCommandRequest):
     try:
-        res = vlc_manager.command(req.command)
+        res = await vlc_manager.command(req.command)
         return {"result": res}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -1193,13 +1743,13 @@ async def vlc_command(req: VLCCommandRequest):
 @app.get("/api/vlc/status", dependencies=[Depends(verify_token)])
 async def vlc_status():
     try:
-        return vlc_manager.get_status()
+        return await vlc_manager.get_status()
     except Exception as e:
         return {"state": "error", "title": str(e)}
 
 @app.post("/api/vlc/kill", dependencies=[Depends(verify_token)])
 async def vlc_kill():
-    vlc_manager.kill()
+    await vlc_manager.kill()
     return {"success": True}
 
 # --- Remo Media Player Endpoints ---
@@ -1330,58 +1880,49 @@ async def remo_launch_viewer(req: RemoViewerLaunchRequest, request: Request, tok
 
 # --- Shortcuts Endpoints ---
 
+# Interpreter prefixes for shortcuts, by explicit type or (for "auto") by extension
+_SHORTCUT_TYPE_CMDS = {
+    "python": [sys.executable],
+    "node": ["node"],
+    "bash": ["bash"],
+}
+_SHORTCUT_EXT_CMDS = {
+    ".py": [sys.executable],
+    ".js": ["node"],
+    ".sh": ["bash"],
+    ".ps1": ["powershell", "-ExecutionPolicy", "Bypass", "-File"],
+    ".bat": ["cmd.exe", "/c"],
+}
+
+def _shortcut_prefix(s: Shortcut) -> List[str]:
+    if s.type == "auto":
+        return _SHORTCUT_EXT_CMDS.get(os.path.splitext(s.path)[1].lower(), [])
+    return _SHORTCUT_TYPE_CMDS.get(s.type, [])
+
 def build_command(s: Shortcut) -> str:
     # Construct a shell string command for Terminal injection
     # Simple join for now, might need quoting
     base = s.path
     if " " in base: base = f'"{base}"'
 
-    args = s.args
-
-    # Determine prefix based on type/ext
-    ext = os.path.splitext(s.path)[1].lower()
-    prefix = ""
-
-    if s.type == "auto":
-        if ext == ".py": prefix = "python "
-        elif ext == ".js": prefix = "node "
-        elif ext == ".sh": prefix = "bash "
-        elif ext == ".ps1": prefix = "powershell -ExecutionPolicy Bypass -File "
-        elif ext == ".bat": prefix = "" # cmd handles it
-    elif s.type == "python": prefix = "python "
-    elif s.type == "node": prefix = "node "
-    elif s.type == "bash": prefix = "bash "
+    # The terminal resolves python from its own PATH, and cmd runs a .bat
+    # typed at its prompt without a wrapper
+    prefix = _shortcut_prefix(s)
+    if prefix is _SHORTCUT_EXT_CMDS[".bat"]:
+        prefix = []
+    prefix = ["python" if p == sys.executable else p for p in prefix]
 
     # For Terminal, we just type it in
-    return f"{prefix}{base} {args}".strip()
+    return " ".join(prefix + [base, s.args or ""]).strip()
 
 def build_command_list(s: Shortcut) -> List[str]:
     # Construct list for subprocess
-    path = s.path
     try:
         args = shlex.split(s.args) if s.args else []
     except:
         args = s.args.split(" ") if s.args else []
 
-    ext = os.path.splitext(path)[1].lower()
-
-    # Defaults
-    cmd = [path] + args
-
-    if s.type == "auto":
-        if ext == ".py": cmd = [sys.executable, path] + args
-        elif ext == ".js": cmd = ["node", path] + args
-        elif ext == ".sh": cmd = ["bash", path] + args
-        elif ext == ".ps1": cmd = ["powershell", "-ExecutionPolicy", "Bypass", "-File", path] + args
-        elif ext == ".bat": cmd = ["cmd.exe", "/c", path] + args
-    elif s.type == "python":
-        cmd = [sys.executable, path] + args
-    elif s.type == "node":
-        cmd = ["node", path] + args
-    elif s.type == "bash":
-        cmd = ["bash", path] + args
-
-    return cmd
+    return _shortcut_prefix(s) + [s.path] + args
 
 @app.get("/api/shortcuts", dependencies=[Depends(verify_token)])
 async def list_shortcuts():
@@ -1445,31 +1986,55 @@ async def run_shortcut_endpoint(sid: str, req: ShortcutRunRequest):
 
     try:
         # Bounded execution
-        proc = subprocess.run(
-            cmd_list,
-            cwd=cwd,
-            capture_output=True,
-            text=True,
-            timeout=30 # 30s timeout
-        )
+        # 30s timeout; each stream capped at ~200KB (the command is stopped once exceeded)
+        returncode, stdout, stderr = await run_process(cmd_list, cwd=cwd, timeout=30, limit=200000)
 
-        stdout = proc.stdout[:200000] # Cap at ~200KB
-        stderr = proc.stderr[:200000]
+        stdout = stdout.decode(errors="replace")
+        stderr = stderr.decode(errors="replace")
 
         return {
             "action": "output",
-            "exit_code": proc.returncode,
+            "exit_code": returncode,
             "stdout": stdout,
             "stderr": stderr
         }
 
-    except subprocess.TimeoutExpired:
+    except asyncio.TimeoutError:
         return {"action": "output", "exit_code": -1, "stdout": "", "stderr": "Execution Timeout (30s)"}
     except Exception as e:
         return {"action": "output", "exit_code": -1, "stdout": "", "stderr": f"Error: {str(e)}"}
 
 # --- Git Manager Endpoints ---
 
+@functools.lru_cache(maxsize=32)
+def _resolve_roots(roots: tuple) -> tuple:
+    """
+    Resolved, case-normalized jail roots as (root, root + sep) pairs, keyed on
+    the raw setting values.
+    """
+    resolved = []
+    for r in roots:
+        if not r:
+            continue
+        try:
+            resolved.append(_root_pair(Path(r).expanduser().resolve()))
+        except Exception: pass
+    return tuple(resolved)
+
+def _root_pair(root: Path) -> tuple:
+    r = os.path.normcase(str(root))
+    return (r, r if r.endswith(os.sep) else r + os.sep)
+
+def _jail_roots() -> tuple:
+    settings = settings_manager.settings
+    raw = (settings.get("filesystem_root"),) + tuple(settings.get("filesystem_extra_roots", []))
+    return _resolve_roots(raw)
+
+def _within_roots(target: Path, roots: tuple) -> bool:
+    """Prefix containment check against resolved roots (replaces os.path.commonpath)."""
+    t = os.path.normcase(str(target))
+    return any(t == root or t.startswith(prefix) for root, prefix in roots)
+
 def check_path_access(path: str) -> Path:
     """
     Validates if the requested path is allowed under the current filesystem mode.
@@ -1487,38 +2052,16 @@ def check_path_access(path: str) -> Path:
 
     # Jailed Mode
     if mode == "jailed":
-        root_str = settings_manager.settings.get("filesystem_root")
-        extra_roots = settings_manager.settings.get("filesystem_extra_roots", [])
-
-        allowed_roots = []
-        if root_str:
-            try:
-                allowed_roots.append(Path(root_str).expanduser().resolve())
-            except: pass
-
-        for er in extra_roots:
-            try:
-                allowed_roots.append(Path(er).expanduser().resolve())
-            except: pass
+        # Roots are resolved once per distinct setting value; the target is
+        # always resolved fresh so symlink changes can't slip past the jail
+        allowed_roots = _jail_roots()
 
         if not allowed_roots:
             # If jailed but no roots configured, block everything
             raise HTTPException(status_code=500, detail="Filesystem is jailed but no roots are configured.")
 
         # Check if target is inside any allowed root
-        is_allowed = False
-        for root in allowed_roots:
-            # Check if target starts with root path
-            try:
-                # Use commonpath to verify containment
-                if os.path.commonpath([root, target]) == str(root):
-                    is_allowed = True
-                    break
-            except ValueError:
-                # Paths on different drives
-                continue
-
-        if not is_allowed:
+        if not _within_roots(target, allowed_roots):
             raise HTTPException(status_code=403, detail="Access denied: Path is outside filesystem jail")
 
         return target
@@ -1535,7 +2078,8 @@ async def get_git_credentials():
     return creds
 
 @app.post("/api/git/credentials", dependencies=[Depends(verify_token)])
-async def save_git_credentials(req: GitCredentialsRequest):
+@threadpool_endpoint
+def save_git_credentials(req: GitCredentialsRequest):
     current = git_cred_manager.load()
 
     # Update fields if provided
@@ -1558,60 +2102,131 @@ async def save_git_credentials(req: GitCredentialsRequest):
 
     return {"success": True}
 
+# GitPython repos are reused across requests: building one re-reads the config
+# and starts fresh cat-file helpers. An entry is rebuilt when .git/HEAD changes
+# (checkout, branch switch). Repos aren't thread-safe, so each is used under a lock.
+_GIT_REPO_CACHE_SIZE = 64
+GIT_PROBE_CONCURRENCY = 8
+_GIT_REPO_CACHE = collections.OrderedDict() # abs path -> (head mtime, Repo, Lock)
+_GIT_REPO_CACHE_LOCK = threading.Lock()
+
+@contextmanager
+def _open_repo(path: str):
+    key = os.path.abspath(path)
+    try:
+        head = os.stat(os.path.join(key, ".git", "HEAD")).st_mtime_ns
+    except OSError:
+        head = None
+
+    if head is None:
+        # Not a plain checkout (or missing): let GitPython report it, uncached
+        yield git.Repo(path)
+        return
+
+    with _GIT_REPO_CACHE_LOCK:
+        entry = _GIT_REPO_CACHE.get(key)
+        if entry and entry[0] == head:
+            _GIT_REPO_CACHE.move_to_end(key)
+        else:
+            entry = None
+
+    if entry is None:
+        entry = (head, git.Repo(key), threading.Lock())
+        with _GIT_REPO_CACHE_LOCK:
+            _GIT_REPO_CACHE[key] = entry
+            _GIT_REPO_CACHE.move_to_end(key)
+            while len(_GIT_REPO_CACHE) > _GIT_REPO_CACHE_SIZE:
+                _GIT_REPO_CACHE.popitem(last=False)
+
+    with entry[2]:
+        yield entry[1]
+
+_PORCELAIN_TYPES = {"D": "deleted", "A": "added", "R": "renamed"}
+# Space-separated fields per porcelain v2 record type; the path is the last one
+_PORCELAIN_FIELDS = {"1": 9, "2": 10, "u": 11}
+
+def _porcelain_status(path: str, untracked: str = "all") -> dict:
+    """
+    Branch and changed files from a single `git status --porcelain=v2 --branch`.
+    Files use the status endpoint's shape; unstaged changes win over staged ones.
+    """
+    proc = subprocess.run(
+        ["git", "-C", path, "status", "--porcelain=v2", "--branch", "-z", f"--untracked-files={untracked}"],
+        capture_output=True, timeout=30
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.decode(errors="replace").strip() or f"git status exited with {proc.returncode}")
+
+    branch = "No Branch"
+    files = []
+    records = iter(proc.stdout.decode(errors="replace").split("\0"))
+    for rec in records:
+        kind = rec[:2]
+        if rec.startswith("# branch.head "):
+            head = rec[14:]
+            branch = "Detached" if head == "(detached)" else head
+        elif kind in ("1 ", "2 ", "u "):
+            xy = rec[2:4]
+            name = rec.split(" ", _PORCELAIN_FIELDS[rec[0]] - 1)[-1]
+            if kind == "2 ":
+                next(records, None) # Rename source path
+            staged = xy[1] == "."
+            code = xy[0] if staged else xy[1]
+            files.append({"file": name, "type": _PORCELAIN_TYPES.get(code, "modified"), "staged": staged})
+        elif kind == "? ":
+            files.append({"file": rec[2:], "type": "untracked", "staged": False})
+
+    return {"branch": branch, "files": files}
+
+def _repo_info(path: str) -> dict:
+    status = "Unknown"
+    branch = "Unknown"
+    changed = False
+    try:
+        # Dirty/untracked only needs a yes/no, so don't expand untracked dirs
+        st = _porcelain_status(path, untracked="normal")
+        branch = st["branch"]
+        changed = bool(st["files"])
+        status = "Dirty" if changed else "Clean"
+    except Exception as e:
+        status = f"Error: {str(e)}"
+
+    return {
+        "path": path,
+        "name": os.path.basename(path),
+        "status": status,
+        "branch": branch,
+        "changed": changed
+    }
+
 @app.get("/api/git/repos", dependencies=[Depends(verify_token)])
 async def list_git_repos():
     repos = settings_manager.settings.get("git_repos", [])
-    result = []
 
     # Get current mode and roots for filtering
     mode = settings_manager.settings.get("filesystem_mode", "open")
-    allowed_roots = []
-    if mode == "jailed":
-        root_str = settings_manager.settings.get("filesystem_root")
-        if root_str: allowed_roots.append(Path(root_str).expanduser().resolve())
-        for er in settings_manager.settings.get("filesystem_extra_roots", []):
-             allowed_roots.append(Path(er).expanduser().resolve())
+    allowed_roots = _jail_roots() if mode == "jailed" else ()
 
+    visible = []
     for path in repos:
         # Check access (Filter out repos outside jail in JAILED mode)
         if mode == "jailed":
             try:
-                p_obj = Path(path).expanduser().resolve()
-                is_allowed = False
-                for ar in allowed_roots:
-                    try:
-                        if os.path.commonpath([ar, p_obj]) == str(ar):
-                            is_allowed = True
-                            break
-                    except: continue
-                if not is_allowed:
+                if not _within_roots(Path(path).expanduser().resolve(), allowed_roots):
                     continue
             except:
                 continue
 
-        status = "Unknown"
-        branch = "Unknown"
-        changed = False
-        try:
-            if git:
-                r = git.Repo(path)
-                try:
-                    branch = r.active_branch.name
-                except:
-                    branch = "Detached"
-                changed = r.is_dirty() or (len(r.untracked_files) > 0)
-                status = "Dirty" if changed else "Clean"
-        except Exception as e:
-            status = f"Error: {str(e)}"
-
-        result.append({
-            "path": path,
-            "name": os.path.basename(path),
-            "status": status,
-            "branch": branch,
-            "changed": changed
-        })
-    return result
+        visible.append(path)
+
+    # Probe repos in parallel (each probe forks git), bounded so long lists don't fork-bomb
+    limit = asyncio.Semaphore(GIT_PROBE_CONCURRENCY)
+
+    async def probe(path):
+        async with limit:
+            return await run_in_threadpool(_repo_info, path)
+
+    return list(await asyncio.gather(*(probe(p) for p in visible)))
 
 @app.post("/api/git/repos", dependencies=[Depends(verify_token)])
 async def add_git_repo(req: GitRepoRequest):
@@ -1626,7 +2241,7 @@ async def add_git_repo(req: GitRepoRequest):
     if p not in current:
         current.append(p)
         settings_manager.settings["git_repos"] = current
-        settings_manager.save_settings()
+        settings_manager.schedule_save()
     return {"success": True}
 
 @app.post("/api/git/repos/remove", dependencies=[Depends(verify_token)])
@@ -1636,14 +2251,14 @@ async def remove_git_repo(req: GitRepoRequest):
     if p in current:
         current.remove(p)
         settings_manager.settings["git_repos"] = current
-        settings_manager.save_settings()
+        settings_manager.schedule_save()
 
     if req.delete_files:
         try:
             # Validate safety
             p_obj = check_path_access(p)
             if p_obj.exists() and p_obj.is_dir():
-                shutil.rmtree(p_obj)
+                await asyncio.to_thread(_fast_rmtree, str(p_obj))
         except Exception as e:
             # If removing from settings succeeded but file delete failed, we still return success
             # but maybe log it?
@@ -1653,7 +2268,8 @@ async def remove_git_repo(req: GitRepoRequest):
     return {"success": True}
 
 @app.post("/api/git/clone", dependencies=[Depends(verify_token)])
-async def git_clone(req: GitCloneRequest):
+@threadpool_endpoint
+def git_clone(req: GitCloneRequest):
     if not git: raise HTTPException(status_code=501, detail="GitPython not installed")
 
     # Determine Destination
@@ -1670,10 +2286,8 @@ async def git_clone(req: GitCloneRequest):
         name = req.name
         if not name:
              # Try to parse from URL
-             try:
-                 name = req.url.split("/")[-1]
-                 if name.endswith(".git"): name = name[:-4]
-             except: pass
+             name = urlsplit(req.url).path.rstrip("/").rsplit("/", 1)[-1]
+             if name.endswith(".git"): name = name[:-4]
 
         if not name:
              raise HTTPException(status_code=400, detail="Could not determine repository name")
@@ -1710,13 +2324,12 @@ async def git_clone(req: GitCloneRequest):
                  env["GIT_PASSWORD"] = token
                  env["GIT_TERMINAL_PROMPT"] = "0"
             else:
-                 # Fallback: Inject into URL
-                 safe_user = quote_plus(username)
-                 safe_token = quote_plus(token)
-                 if clone_url.startswith("https://"):
-                     clone_url = clone_url.replace("https://", f"https://{safe_user}:{safe_token}@", 1)
-                 elif clone_url.startswith("http://"):
-                     clone_url = clone_url.replace("http://", f"http://{safe_user}:{safe_token}@", 1)
+                 # Fallback: Inject into URL (replacing any userinfo already present)
+                 parts = urlsplit(clone_url)
+                 if parts.scheme in ("http", "https"):
+                     host = parts.netloc.rpartition("@")[2]
+                     netloc = f"{quote(username, safe='')}:{quote(token, safe='')}@{host}"
+                     clone_url = urlunsplit(parts._replace(netloc=netloc))
 
         git.Repo.clone_from(clone_url, str(p_obj), env=env)
 
@@ -1725,7 +2338,7 @@ async def git_clone(req: GitCloneRequest):
         if str(p_obj) not in current:
             current.append(str(p_obj))
             settings_manager.settings["git_repos"] = current
-            settings_manager.save_settings()
+            settings_manager.schedule_save()
 
         return {"success": True}
     except Exception as e:
@@ -1770,295 +2383,273 @@ def _collect_branch_state(repo):
     }
 
 @app.get("/api/git/branches", dependencies=[Depends(verify_token)])
-async def git_list_branches(path: str):
+@threadpool_endpoint
+def git_list_branches(path: str):
     check_path_access(path)
     if not git:
         raise HTTPException(status_code=501, detail="GitPython not installed")
     try:
-        r = git.Repo(path)
-        return _collect_branch_state(r)
+        with _open_repo(path) as r:
+            return _collect_branch_state(r)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/git/fetch", dependencies=[Depends(verify_token)])
-async def git_fetch(req: GitRepoRequest):
+@serialize_repo
+@threadpool_endpoint
+def git_fetch(req: GitRepoRequest):
     check_path_access(req.path)
     if not git:
         raise HTTPException(status_code=501, detail="GitPython not installed")
     try:
-        r = git.Repo(req.path)
-        origin = r.remote(name='origin')
-        env = {"GIT_SSH_COMMAND": "ssh -o StrictHostKeyChecking=no"}
-        creds = git_cred_manager.load()
-        if creds.get("username") and creds.get("token"):
-            askpass_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "git_askpass.py")
-            if os.path.exists(askpass_script):
-                env["GIT_ASKPASS"] = askpass_script
-                env["GIT_USERNAME"] = creds["username"]
-                env["GIT_PASSWORD"] = creds["token"]
-                env["GIT_TERMINAL_PROMPT"] = "0"
-        with r.git.custom_environment(**env):
-            r.git.fetch("--all", "--prune")
-        return {"success": True}
+        with _open_repo(req.path) as r:
+            origin = r.remote(name='origin')
+            env = {"GIT_SSH_COMMAND": "ssh -o StrictHostKeyChecking=no"}
+            creds = git_cred_manager.load()
+            if creds.get("username") and creds.get("token"):
+                askpass_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "git_askpass.py")
+                if os.path.exists(askpass_script):
+                    env["GIT_ASKPASS"] = askpass_script
+                    env["GIT_USERNAME"] = creds["username"]
+                    env["GIT_PASSWORD"] = creds["token"]
+                    env["GIT_TERMINAL_PROMPT"] = "0"
+            with r.git.custom_environment(**env):
+                r.git.fetch("--all", "--prune")
+            return {"success": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/git/branches/checkout", dependencies=[Depends(verify_token)])
-async def git_checkout_branch(req: GitBranchCheckoutRequest):
+@serialize_repo
+@threadpool_endpoint
+def git_checkout_branch(req: GitBranchCheckoutRequest):
     check_path_access(req.path)
     if not git:
         raise HTTPException(status_code=501, detail="GitPython not installed")
     try:
-        r = git.Repo(req.path)
-        branch = req.branch.strip()
-        if not branch:
-            raise HTTPException(status_code=400, detail="Branch name is required")
+        with _open_repo(req.path) as r:
+            branch = req.branch.strip()
+            if not branch:
+                raise HTTPException(status_code=400, detail="Branch name is required")
 
-        if req.create:
-            start_point = (req.start_point or "HEAD").strip()
-            r.git.checkout("-B", branch, start_point)
-        else:
-            if req.track_remote and "/" in branch:
-                local_name = branch.split("/", 1)[1]
-                r.git.checkout("-B", local_name, "--track", branch)
+            if req.create:
+                start_point = (req.start_point or "HEAD").strip()
+                r.git.checkout("-B", branch, start_point)
             else:
-                r.git.checkout(branch)
+                if req.track_remote and "/" in branch:
+                    local_name = branch.split("/", 1)[1]
+                    r.git.checkout("-B", local_name, "--track", branch)
+                else:
+                    r.git.checkout(branch)
 
-        return {"success": True, "branch": r.active_branch.name if not r.head.is_detached else "Detached"}
+            return {"success": True, "branch": r.active_branch.name if not r.head.is_detached else "Detached"}
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/git/branches/create", dependencies=[Depends(verify_token)])
-async def git_create_branch(req: GitBranchCreateRequest):
+@serialize_repo
+@threadpool_endpoint
+def git_create_branch(req: GitBranchCreateRequest):
     check_path_access(req.path)
     if not git:
         raise HTTPException(status_code=501, detail="GitPython not installed")
     try:
-        r = git.Repo(req.path)
-        branch = req.branch.strip()
-        if not branch:
-            raise HTTPException(status_code=400, detail="Branch name is required")
-        start_point = (req.start_point or "HEAD").strip()
-        r.git.branch(branch, start_point)
-        return {"success": True}
+        with _open_repo(req.path) as r:
+            branch = req.branch.strip()
+            if not branch:
+                raise HTTPException(status_code=400, detail="Branch name is required")
+            start_point = (req.start_point or "HEAD").strip()
+            r.git.branch(branch, start_point)
+            return {"success": True}
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/git/branches/delete", dependencies=[Depends(verify_token)])
-async def git_delete_branch(req: GitBranchDeleteRequest):
+@serialize_repo
+@threadpool_endpoint
+def git_delete_branch(req: GitBranchDeleteRequest):
     check_path_access(req.path)
     if not git:
         raise HTTPException(status_code=501, detail="GitPython not installed")
     try:
-        r = git.Repo(req.path)
-        branch = req.branch.strip()
-        if not branch:
-            raise HTTPException(status_code=400, detail="Branch name is required")
-        if not r.head.is_detached and branch == r.active_branch.name:
-            raise HTTPException(status_code=400, detail="Cannot delete checked-out branch")
+        with _open_repo(req.path) as r:
+            branch = req.branch.strip()
+            if not branch:
+                raise HTTPException(status_code=400, detail="Branch name is required")
+            if not r.head.is_detached and branch == r.active_branch.name:
+                raise HTTPException(status_code=400, detail="Cannot delete checked-out branch")
 
-        if req.force:
-            r.git.branch("-D", branch)
-        else:
-            r.git.branch("-d", branch)
-        return {"success": True}
+            if req.force:
+                r.git.branch("-D", branch)
+            else:
+                r.git.branch("-d", branch)
+            return {"success": True}
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def _git_status(r) -> dict:
+    # Branch and file list come from one porcelain call; GitPython fills in the rest
+    st = _porcelain_status(r.working_tree_dir)
+
+    history = []
+    try:
+        for c in list(r.iter_commits(max_count=10)):
+            history.append({
+                "hexsha": c.hexsha[:7],
+                "message": c.message.strip(),
+                "author": str(c.author),
+                "time": c.committed_datetime.isoformat()
+            })
+    except: pass
+
+    return {
+        "branch": st["branch"],
+        "branches": _collect_branch_state(r),
+        "files": st["files"],
+        "history": history
+    }
+
 @app.get("/api/git/status", dependencies=[Depends(verify_token)])
-async def get_git_status(path: str):
+@threadpool_endpoint
+def get_git_status(path: str):
     check_path_access(path) # Validate Access
     if not git:
          raise HTTPException(status_code=501, detail="GitPython not installed")
     try:
-        try:
-            r = git.Repo(path)
-        except git.exc.InvalidGitRepositoryError:
-            return {"error": "Invalid Git Repository", "branch": "Invalid", "files": [], "history": []}
-        except git.exc.NoSuchPathError:
-            return {"error": "Path not found", "branch": "Missing", "files": [], "history": []}
-
-        diffs = []
-        seen_files = set()
-
-        def diff_type(item):
-            ct = item.change_type
-            if ct == 'D': return "deleted"
-            elif ct == 'A': return "added"
-            elif ct == 'R': return "renamed"
-            return "modified"
-
-        # Working tree changes (unstaged)
-        try:
-            for item in r.index.diff(None):
-                path = item.a_path or item.b_path
-                diffs.append({"file": path, "type": diff_type(item), "staged": False})
-                seen_files.add(path)
-        except: pass
-
-        # Diff against HEAD (staged changes, only if HEAD exists)
-        try:
-            _ = r.head.commit
-            for item in r.index.diff("HEAD"):
-                path = item.a_path or item.b_path
-                if path not in seen_files:
-                    diffs.append({"file": path, "type": diff_type(item), "staged": True})
-                    seen_files.add(path)
-        except ValueError:
-            # Empty repo (no commits)
-            pass
-        except: pass
-
-        # Untracked
-        try:
-            for f in r.untracked_files:
-                diffs.append({"file": f, "type": "untracked", "staged": False})
-        except: pass
-
-        history = []
-        try:
-            for c in list(r.iter_commits(max_count=10)):
-                history.append({
-                    "hexsha": c.hexsha[:7],
-                    "message": c.message.strip(),
-                    "author": str(c.author),
-                    "time": c.committed_datetime.isoformat()
-                })
-        except: pass
-
-        branch_name = "Unknown"
-        try:
-            if r.head.is_detached:
-                branch_name = "Detached"
-            else:
-                branch_name = r.active_branch.name
-        except:
-            # Likely empty repo without branch yet
-            try: branch_name = r.git.branch(show_current=True) or "No Branch"
-            except: branch_name = "No Branch"
-
-        return {
-            "branch": branch_name,
-            "branches": _collect_branch_state(r),
-            "files": diffs,
-            "history": history
-        }
+        with _open_repo(path) as r:
+            return _git_status(r)
+    except git.exc.InvalidGitRepositoryError:
+        return {"error": "Invalid Git Repository", "branch": "Invalid", "files": [], "history": []}
+    except git.exc.NoSuchPathError:
+        return {"error": "Path not found", "branch": "Missing", "files": [], "history": []}
     except Exception as e:
         # Return structured error instead of 500
         return {"error": str(e), "branch": "Error", "branches": {"current": "Error", "local": [], "remote": []}, "files": [], "history": []}
 
 @app.post("/api/git/commit", dependencies=[Depends(verify_token)])
-async def git_commit(req: GitRepoRequest):
+@serialize_repo
+@threadpool_endpoint
+def git_commit(req: GitRepoRequest):
     check_path_access(req.path) # Validate Access
     if not git: raise HTTPException(status_code=501)
     try:
-        r = git.Repo(req.path)
-        if req.files and len(req.files) > 0:
-            r.git.reset()
-            for f in req.files:
-                r.git.add(f)
-        else:
-            r.git.add(A=True)
-        r.index.commit(req.message or "Update from RemoDash")
-        return {"success": True}
+        with _open_repo(req.path) as r:
+            if req.files and len(req.files) > 0:
+                r.git.reset()
+                for f in req.files:
+                    r.git.add(f)
+            else:
+                r.git.add(A=True)
+            r.index.commit(req.message or "Update from RemoDash")
+            return {"success": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/git/diff", dependencies=[Depends(verify_token)])
-async def get_git_diff(path: str, file: str):
+@threadpool_endpoint
+def get_git_diff(path: str, file: str):
     check_path_access(path) # Validate Access
     if not git: raise HTTPException(status_code=501)
     try:
-        r = git.Repo(path)
+        with _open_repo(path) as r:
 
-        # Check if file is untracked first - show its content as diff
-        if file in r.untracked_files:
-            try:
-                file_path = os.path.join(path, file)
-                with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                    content = f.read()
-                lines = content.split('\n')
-                diff_lines = [f"diff --git a/{file} b/{file}", "new file", f"--- /dev/null", f"+++ b/{file}"]
-                for line in lines:
-                    diff_lines.append(f"+{line}")
-                diff = '\n'.join(diff_lines)
-            except:
-                diff = ""
-        else:
-            try:
-                diff = r.git.diff('HEAD', '--', file)
-                if not diff:
-                    # Try unstaged diff
-                    diff = r.git.diff('--', file)
-            except:
+            # Check if file is untracked first - show its content as diff
+            if file in r.untracked_files:
                 try:
-                    diff = r.git.diff('--', file)
+                    file_path = os.path.join(path, file)
+                    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
+                        content = f.read()
+                    lines = content.split('\n')
+                    diff_lines = [f"diff --git a/{file} b/{file}", "new file", f"--- /dev/null", f"+++ b/{file}"]
+                    for line in lines:
+                        diff_lines.append(f"+{line}")
+                    diff = '\n'.join(diff_lines)
                 except:
                     diff = ""
+            else:
+                try:
+                    diff = r.git.diff('HEAD', '--', file)
+                    if not diff:
+                        # Try unstaged diff
+                        diff = r.git.diff('--', file)
+                except:
+                    try:
+                        diff = r.git.diff('--', file)
+                    except:
+                        diff = ""
 
-        return {"diff": diff}
+            return {"diff": diff}
     except Exception as e:
         return {"diff": f"Error: {str(e)}"}
 
 @app.post("/api/git/push", dependencies=[Depends(verify_token)])
-async def git_push(req: GitRepoRequest):
+@serialize_repo
+@threadpool_endpoint
+def git_push(req: GitRepoRequest):
     check_path_access(req.path) # Validate Access
     if not git: raise HTTPException(status_code=501)
     try:
-        r = git.Repo(req.path)
-        origin = r.remote(name='origin')
-
-        env = {"GIT_SSH_COMMAND": "ssh -o StrictHostKeyChecking=no"}
-        creds = git_cred_manager.load()
-        if creds.get("username") and creds.get("token"):
-            askpass_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "git_askpass.py")
-            if os.path.exists(askpass_script):
-                 env["GIT_ASKPASS"] = askpass_script
-                 env["GIT_USERNAME"] = creds["username"]
-                 env["GIT_PASSWORD"] = creds["token"]
-                 env["GIT_TERMINAL_PROMPT"] = "0"
-
-        with r.git.custom_environment(**env):
-            origin.push()
-        return {"success": True}
+        with _open_repo(req.path) as r:
+            origin = r.remote(name='origin')
+
+            env = {"GIT_SSH_COMMAND": "ssh -o StrictHostKeyChecking=no"}
+            creds = git_cred_manager.load()
+            if creds.get("username") and creds.get("token"):
+                askpass_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "git_askpass.py")
+                if os.path.exists(askpass_script):
+                     env["GIT_ASKPASS"] = askpass_script
+                     env["GIT_USERNAME"] = creds["username"]
+                     env["GIT_PASSWORD"] = creds["token"]
+                     env["GIT_TERMINAL_PROMPT"] = "0"
+
+            with r.git.custom_environment(**env):
+                origin.push()
+            return {"success": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/api/git/pull", dependencies=[Depends(verify_token)])
-async def git_pull(req: GitRepoRequest):
+@serialize_repo
+@threadpool_endpoint
+def git_pull(req: GitRepoRequest):
     check_path_access(req.path) # Validate Access
     if not git: raise HTTPException(status_code=501)
     try:
-        r = git.Repo(req.path)
-        origin = r.remote(name='origin')
-
-        env = {"GIT_SSH_COMMAND": "ssh -o StrictHostKeyChecking=no"}
-        creds = git_cred_manager.load()
-        if creds.get("username") and creds.get("token"):
-            askpass_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "git_askpass.py")
-            if os.path.exists(askpass_script):
-                 env["GIT_ASKPASS"] = askpass_script
-                 env["GIT_USERNAME"] = creds["username"]
-                 env["GIT_PASSWORD"] = creds["token"]
-                 env["GIT_TERMINAL_PROMPT"] = "0"
-
-        with r.git.custom_environment(**env):
-            origin.pull()
-        return {"success": True}
+        with _open_repo(req.path) as r:
+            origin = r.remote(name='origin')
+
+            env = {"GIT_SSH_COMMAND": "ssh -o StrictHostKeyChecking=no"}
+            creds = git_cred_manager.load()
+            if creds.get("username") and creds.get("token"):
+                askpass_script = os.path.join(os.path.dirname(os.path.abspath(__file__)), "git_askpass.py")
+                if os.path.exists(askpass_script):
+                     env["GIT_ASKPASS"] = askpass_script
+                     env["GIT_USERNAME"] = creds["username"]
+                     env["GIT_PASSWORD"] = creds["token"]
+                     env["GIT_TERMINAL_PROMPT"] = "0"
+
+            with r.git.custom_environment(**env):
+                origin.pull()
+            return {"success": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 # --- SSH Key Management ---
 
+def _ssh_fingerprint(pub_content: str) -> str:
+    """OpenSSH-style SHA256 fingerprint of a public key line, computed in-process."""
+    raw = base64.b64decode(pub_content.split()[1])
+    return "SHA256:" + base64.b64encode(hashlib.sha256(raw).digest()).rstrip(b"=").decode()
+
 @app.get("/api/git/ssh_key", dependencies=[Depends(verify_token)])
-async def get_ssh_key():
-    """Checks for SSH key and returns public key + fingerprint."""
+async def get_ssh_key(randomart: bool = False):
+    """Checks for SSH key and returns public key + fingerprint (ssh-keygen randomart on request)."""
     ssh_dir = Path.home() / ".ssh"
     # Prefer Ed25519, fall back to RSA
     key_types = ["id_ed25519", "id_rsa"]
@@ -2076,13 +2667,12 @@ async def get_ssh_key():
         pub_path = found_key.with_suffix(".pub")
         pub_content = pub_path.read_text(encoding="utf-8").strip()
 
-        # Get Fingerprint (Randomart)
-        # ssh-keygen -lv -f /path/to/key
-        proc = subprocess.run(
-            ["ssh-keygen", "-lv", "-f", str(found_key)],
-            capture_output=True, text=True
-        )
-        fingerprint = proc.stdout
+        if randomart:
+            # ssh-keygen -lv -f /path/to/key
+            _, stdout, _ = await run_process(["ssh-keygen", "-lv", "-f", str(found_key)])
+            fingerprint = stdout.decode(errors="replace")
+        else:
+            fingerprint = _ssh_fingerprint(pub_content)
 
         return {
             "exists": True,
@@ -2111,10 +2701,10 @@ async def generate_ssh_key():
             "-f", str(key_path),
             "-N", ""
         ]
-        proc = subprocess.run(cmd, capture_output=True, text=True)
+        returncode, _, stderr = await run_process(cmd)
 
-        if proc.returncode != 0:
-            raise Exception(proc.stderr)
+        if returncode != 0:
+            raise Exception(stderr.decode(errors="replace"))
 
         return {"success": True}
     except Exception as e:
@@ -2124,9 +2714,30 @@ async def generate_ssh_key():
 @app.get("/api/sysinfo", dependencies=[Depends(verify_token)])
 async def get_sysinfo():
     """Returns static system information."""
+    static = _SYSINFO_STATIC or await _sysinfo_static_task()
+    partitions = await asyncio.to_thread(_sysinfo_partitions)
+    return {**static, "partitions": partitions}
+
+# Hostname, IP, CPU model and standard paths don't change while the server
+# runs; probed once (warmed from lifespan) instead of per request
+_SYSINFO_STATIC: Optional[dict] = None
+_SYSINFO_TASK: Optional[asyncio.Task] = None
+
+def _sysinfo_static_task() -> asyncio.Task:
+    # Requests arriving while the startup probe runs wait on it rather than
+    # starting their own; a failed probe (or one from a closed loop) is redone
+    global _SYSINFO_TASK
+    task = _SYSINFO_TASK
+    if task is None or task.get_loop() is not asyncio.get_running_loop() or (task.done() and _SYSINFO_STATIC is None):
+        task = _SYSINFO_TASK = asyncio.create_task(_load_sysinfo_static())
+    return task
+
+async def _load_sysinfo_static() -> dict:
+    global _SYSINFO_STATIC
     hostname = socket.gethostname()
     try:
-        ip_address = socket.gethostbyname(hostname)
+        # Can block on DNS
+        ip_address = await asyncio.to_thread(socket.gethostbyname, hostname)
     except:
         ip_address = "Unknown"
 
@@ -2134,7 +2745,8 @@ async def get_sysinfo():
     cpu_model = "Unknown"
     if platform.system() == "Windows":
         try:
-            cpu_model = subprocess.check_output(["wmic", "cpu", "get", "name"]).decode().split("\n")[1].strip()
+            _, out, _ = await run_process(["wmic", "cpu", "get", "name"], timeout=10)
+            cpu_model = out.decode().split("\n")[1].strip()
         except: pass
     elif platform.system() == "Linux":
         try:
@@ -2146,29 +2758,7 @@ async def get_sysinfo():
         except: pass
 
     if cpu_model == "Unknown":
-        cpu_model = platform.processor()
-
-    # Partitions
-    partitions = []
-    try:
-        for part in psutil.disk_partitions():
-            try:
-                # Skip inaccessible/dummy partitions
-                if "cdrom" in part.opts or part.fstype == "":
-                    continue
-                usage = psutil.disk_usage(part.mountpoint)
-                partitions.append({
-                    "device": part.device,
-                    "mountpoint": part.mountpoint,
-                    "fstype": part.fstype,
-                    "opts": part.opts,
-                    "total_gb": usage.total / (1024**3),
-                    "used_gb": usage.used / (1024**3),
-                    "percent": usage.percent
-                })
-            except OSError:
-                continue
-    except: pass
+        cpu_model = _OS_INFO["processor"]
 
     # Android Detection & Paths
     is_android = "ANDROID_ROOT" in os.environ or "com.termux" in os.environ.get("PREFIX", "")
@@ -2187,19 +2777,218 @@ async def get_sysinfo():
         if storage_shared.exists():
              standard_paths.append({"name": "Shared Storage", "path": str(storage_shared.resolve())})
 
-    return {
+    _SYSINFO_STATIC = {
         "hostname": hostname,
         "ip_address": ip_address,
-        "os": f"{platform.system()} {platform.release()}",
+        "os": f"{_OS_INFO['system']} {_OS_INFO['release']}",
         "cpu_model": cpu_model,
-        "partitions": partitions,
         "home_dir": home_dir,
         "standard_paths": standard_paths
     }
+    return _SYSINFO_STATIC
+
+def _sysinfo_partitions() -> List[dict]:
+    # Layout comes from the cached partition list; usage is read live
+    partitions = []
+    try:
+        for part in _disk_partitions():
+            try:
+                # Skip inaccessible/dummy partitions
+                if "cdrom" in part.opts or part.fstype == "":
+                    continue
+                usage = psutil.disk_usage(part.mountpoint)
+                partitions.append({
+                    "device": part.device,
+                    "mountpoint": part.mountpoint,
+                    "fstype": part.fstype,
+                    "opts": part.opts,
+                    "total_gb": usage.total / (1024**3),
+                    "used_gb": usage.used / (1024**3),
+                    "percent": usage.percent
+                })
+            except OSError:
+                continue
+    except: pass
+    return partitions
 
 # --- Terminal Logic ---
 
-class WebTerminalSession:
+# Binary terminal frames: byte 0 is the frame type, the rest is the payload.
+# Client -> server: input (UTF-8) or resize (two big-endian u16s: cols, rows).
+# Text frames from the client are still accepted as legacy JSON.
+TERM_FRAME_INPUT = 0x00
+TERM_FRAME_RESIZE = 0x01
+# Server -> client: output (UTF-8)
+TERM_FRAME_OUTPUT = 0x00
+
+def _output_frame(payload: Union[str, bytes]) -> bytes:
+    if isinstance(payload, str):
+        payload = payload.encode()
+    return bytes((TERM_FRAME_OUTPUT,)) + payload
+
+# Output arriving within this window is sent as a single frame
+TERM_COALESCE_WINDOW = 0.01
+# Replay buffer per session; trimmed back to this once it overshoots by a quarter
+TERM_HISTORY_BYTES = 256 * 1024
+# Frames buffered per websocket before a stalled client is disconnected
+TERM_SUBSCRIBER_QUEUE = 256
+# Matches the usual pipe/PTY buffer size, so a burst drains in one read
+TERM_READ_SIZE = 65536
+
+class _TerminalSubscriber:
+    """One websocket's outbound frames, drained by its own task."""
+    __slots__ = ("ws", "queue", "task")
+
+    def __init__(self, ws: WebSocket):
+        self.ws = ws
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=TERM_SUBSCRIBER_QUEUE)
+        self.task = None
+
+class _TerminalOutput:
+    """Output fan-out shared by the terminal session types.
+
+    The reader hands decoded text to `_emit_output`; a sender task coalesces
+    bursts into one frame and queues it for every subscriber. Each subscriber
+    has a bounded queue drained by its own task, so a stalled socket never
+    holds up the others.
+    """
+
+    def _start_output(self):
+        self._out_queue = asyncio.Queue()
+        self._last_flush = float("-inf")
+        self.sender_task = asyncio.create_task(self._send_loop())
+
+    def _watch_fd(self):
+        # The PTY master is watched by the event loop itself, no reader thread
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self.loop.add_reader(self.master_fd, self._on_readable)
+
+    def _unwatch_fd(self):
+        if self.master_fd is not None:
+            try: self.loop.remove_reader(self.master_fd)
+            except: pass
+
+    def _on_readable(self):
+        try:
+            data = os.read(self.master_fd, TERM_READ_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            data = b"" # EIO once the child has exited
+        if data:
+            self._emit_output(self._decoder.decode(data))
+            return
+        # Process likely died
+        self._unwatch_fd()
+        if not self.closed:
+            self._emit_output("\r\n\x1b[1;31m[Process terminated]\x1b[0m\r\n")
+        self.close()
+
+    def _emit_output(self, text: str):
+        # History is only extended by the sender as it broadcasts, so a subscriber
+        # joining while output is still queued gets it live and not also in replay
+        self._out_queue.put_nowait(text.encode())
+
+    def _remember(self, data: bytes):
+        history = self.history
+        history += data
+        if len(history) > TERM_HISTORY_BYTES + TERM_HISTORY_BYTES // 4:
+            cut = len(history) - TERM_HISTORY_BYTES
+            # Don't start the replay in the middle of a UTF-8 sequence
+            while cut < len(history) and history[cut] & 0xC0 == 0x80:
+                cut += 1
+            del history[:cut]
+
+    def _stop_output(self):
+        self._out_queue.put_nowait(None)
+
+    async def _send_loop(self):
+        while True:
+            data = await self._out_queue.get()
+            if data is None:
+                self._broadcast(None)
+                return
+            # Output after an idle gap (keystroke echo) goes out at once; only
+            # output that keeps arriving within the window waits to be merged
+            if self.loop.time() - self._last_flush < TERM_COALESCE_WINDOW:
+                await asyncio.sleep(TERM_COALESCE_WINDOW)
+            parts = [data]
+            stop = False
+            while not self._out_queue.empty():
+                more = self._out_queue.get_nowait()
+                if more is None:
+                    stop = True
+                    break
+                parts.append(more)
+            data = b"".join(parts)
+            self._remember(data)
+            self._broadcast(data)
+            self._last_flush = self.loop.time()
+            if stop:
+                self._broadcast(None)
+                return
+
+    # Subscribers are a copy-on-write tuple: the sender iterates a snapshot
+    def subscribe(self, ws: WebSocket):
+        sub = _TerminalSubscriber(ws)
+        if self.history:
+            # Replay goes through the queue so it can't interleave with live frames
+            sub.queue.put_nowait(_output_frame(self.history))
+        sub.task = asyncio.create_task(self._drain(sub))
+        self.subscribers = (*self.subscribers, sub)
+
+    def unsubscribe(self, ws: WebSocket):
+        for sub in self.subscribers:
+            if sub.ws is ws:
+                self._drop(sub)
+
+    def _drop(self, sub: _TerminalSubscriber):
+        self.subscribers = tuple(s for s in self.subscribers if s is not sub)
+        if sub.task and sub.task is not asyncio.current_task():
+            sub.task.cancel()
+
+    async def _drain(self, sub: _TerminalSubscriber):
+        try:
+            while True:
+                frame = await sub.queue.get()
+                if frame is None:
+                    return
+                await sub.ws.send_bytes(frame)
+        except Exception:
+            self._drop(sub)
+
+    def _broadcast(self, data: Optional[bytes]):
+        # None marks the end of output: drainers exit once their queue is sent
+        frame = _output_frame(data) if data is not None else None
+        for sub in self.subscribers:
+            try:
+                sub.queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                # Skipping terminal output would corrupt the screen, so a
+                # subscriber this far behind is disconnected instead
+                self._drop(sub)
+                asyncio.ensure_future(_close_quietly(sub.ws, 1013))
+
+async def _close_quietly(ws: WebSocket, code: int):
+    try:
+        await ws.close(code=code)
+    except Exception:
+        pass
+
+# Legacy JSON text frames are decoded by a precompiled msgspec decoder when available
+if msgspec:
+    class TermInputMsg(msgspec.Struct, tag="input"):
+        data: str
+
+    class TermResizeMsg(msgspec.Struct, tag="resize"):
+        cols: int = 80
+        rows: int = 24
+
+    _term_msg_decoder = msgspec.json.Decoder(Union[TermInputMsg, TermResizeMsg])
+else:
+    _term_msg_decoder = None
+
+class WebTerminalSession(_TerminalOutput):
     def __init__(self, session_id: str, cwd: Optional[str] = None):
         self.id = session_id
         self.created_at = time.time()
@@ -2212,11 +3001,12 @@ class WebTerminalSession:
         self.os_type = platform.system()
         self.loop = asyncio.get_running_loop()
 
-        self.history = [] # List of strings
-        self.subscribers: set[WebSocket] = set()
+        self.history = bytearray() # Recent output (UTF-8)
+        self.subscribers: tuple = ()
         self.reader_task = None
         self.closed = False
 
+        self._start_output()
         self._start()
 
     def _start(self):
@@ -2295,68 +3085,40 @@ class WebTerminalSession:
 
             if not self.process:
                 print("[Terminal] Critical: Failed to start any shell.")
-                self.history.append("Error: Failed to start shell process. Please check settings.\r\n")
+                self._emit_output("Error: Failed to start shell process. Please check settings.\r\n")
                 self.close()
                 return
 
-        # Start Reader Task
-        self.reader_task = asyncio.create_task(self._read_loop())
+        # Start Reader
+        if self.os_type == "Windows":
+            self.reader_task = asyncio.create_task(self._read_loop())
+        else:
+            self._watch_fd()
 
     async def _read_loop(self):
+        # Windows pipes can't be watched by the selector, so read them in a thread
         while not self.closed:
-            data = await self._read_output()
+            data = await self.loop.run_in_executor(None, self._read_windows)
             if not data:
                 # Process likely died
                 break
 
             try:
-                text = data.decode(errors="replace")
-                self.history.append(text)
-                # Optional: Cap history size?
-                if len(self.history) > 1000:
-                     self.history = self.history[-1000:]
-
-                await self._broadcast(text)
+                self._emit_output(data.decode(errors="replace"))
             except Exception as e:
                 print(f"Terminal Read Error: {e}")
                 break
 
         # Append exit message
         if not self.closed:
-             msg = "\r\n\x1b[1;31m[Process terminated]\x1b[0m\r\n"
-             self.history.append(msg)
-             await self._broadcast(msg)
+             self._emit_output("\r\n\x1b[1;31m[Process terminated]\x1b[0m\r\n")
 
         self.close()
 
-    async def _broadcast(self, text: str):
-        msg = json.dumps({"type": "output", "data": text})
-        to_remove = []
-        for ws in self.subscribers:
-            try:
-                await ws.send_text(msg)
-            except:
-                to_remove.append(ws)
-        for ws in to_remove:
-            self.subscribers.discard(ws)
-
-    async def _read_output(self):
-        if self.os_type == "Windows":
-            return await self.loop.run_in_executor(None, self._read_windows)
-        else:
-            return await self.loop.run_in_executor(None, self._read_linux)
-
     def _read_windows(self):
         if self.process and self.process.stdout:
-            return self.process.stdout.read(1024)
-        return b""
-
-    def _read_linux(self):
-        if self.master_fd:
-            try:
-                return os.read(self.master_fd, 1024)
-            except OSError:
-                return b""
+            # Unbuffered pipe: one read returns whatever is available
+            return self.process.stdout.read(TERM_READ_SIZE)
         return b""
 
     def write_input(self, data: str):
@@ -2383,16 +3145,20 @@ class WebTerminalSession:
             except: pass
 
     def close(self):
+        if not self.closed:
+            self._stop_output()
         self.closed = True
         if self.process:
             self.process.terminate()
         if self.os_type != "Windows" and self.master_fd:
+            self._unwatch_fd()
             try: os.close(self.master_fd)
             except: pass
+            self.master_fd = None
         # Cancel reader?
         # if self.reader_task: self.reader_task.cancel()
 
-class LocalPTYSession:
+class LocalPTYSession(_TerminalOutput):
     def __init__(self, session_id: str, cwd: Optional[str] = None):
         self.id = session_id
         self.created_at = time.time()
@@ -2405,11 +3171,12 @@ class LocalPTYSession:
         self.os_type = platform.system()
         self.loop = asyncio.get_running_loop()
 
-        self.history = [] # List of strings
-        self.subscribers: set[WebSocket] = set()
+        self.history = bytearray() # Recent output (UTF-8)
+        self.subscribers: tuple = ()
         self.reader_task = None
         self.closed = False
 
+        self._start_output()
         self._start()
 
     def _start(self):
@@ -2421,8 +3188,9 @@ class LocalPTYSession:
 
         if self.os_type == "Windows":
             # Fallback to subprocess on Windows as PTY fork isn't supported natively
+            self._emit_output("Local PTY mode is not supported on Windows. Please use Web Session.\r\n")
+            self._stop_output()
             self.closed = True
-            self.history.append("Local PTY mode is not supported on Windows. Please use Web Session.\r\n")
             return
 
         shell = settings_manager.settings.get("terminal_shell")
@@ -2452,54 +3220,12 @@ class LocalPTYSession:
                 # Parent process
                 self.pid = pid
                 self.master_fd = master_fd
-                self.reader_task = asyncio.create_task(self._read_loop())
+                self._watch_fd()
         except Exception as e:
             print(f"[Terminal] PTY fork failed: {e}")
-            self.history.append(f"Error: Failed to start PTY. {str(e)}\r\n")
+            self._emit_output(f"Error: Failed to start PTY. {str(e)}\r\n")
             self.close()
 
-    async def _read_loop(self):
-        while not self.closed:
-            data = await self.loop.run_in_executor(None, self._read_linux)
-            if not data:
-                break
-
-            try:
-                text = data.decode(errors="replace")
-                self.history.append(text)
-                if len(self.history) > 1000:
-                    self.history = self.history[-1000:]
-                await self._broadcast(text)
-            except Exception as e:
-                print(f"PTY Read Error: {e}")
-                break
-
-        if not self.closed:
-             msg = "\r\n\x1b[1;31m[Process terminated]\x1b[0m\r\n"
-             self.history.append(msg)
-             await self._broadcast(msg)
-
-        self.close()
-
-    def _read_linux(self):
-        if self.master_fd:
-            try:
-                return os.read(self.master_fd, 1024)
-            except OSError:
-                return b""
-        return b""
-
-    async def _broadcast(self, text: str):
-        msg = json.dumps({"type": "output", "data": text})
-        to_remove = []
-        for ws in self.subscribers:
-            try:
-                await ws.send_text(msg)
-            except:
-                to_remove.append(ws)
-        for ws in to_remove:
-            self.subscribers.discard(ws)
-
     def write_input(self, data: str):
         if self.closed: return
         if self.master_fd:
@@ -2517,6 +3243,8 @@ class LocalPTYSession:
             except: pass
 
     def close(self):
+        if not self.closed:
+            self._stop_output()
         self.closed = True
         if self.pid:
             try:
@@ -2526,22 +3254,17 @@ class LocalPTYSession:
                 os.waitpid(self.pid, os.WNOHANG)
             except: pass
         if self.master_fd:
+            self._unwatch_fd()
             try: os.close(self.master_fd)
             except: pass
+            self.master_fd = None
 
 @app.websocket("/api/terminal/{sid}")
 async def terminal_stream_ws(sid: str, websocket: WebSocket, token: Optional[str] = None, key: Optional[str] = None, cwd: Optional[str] = None, command: Optional[str] = None, mode: Optional[str] = "web"):
     # Verify Auth
-    if not Path("global_flags/no_auth").exists():
-        if key:
-            expiry = SESSION_KEYS.get(key)
-            if not expiry or time.time() > expiry:
-                 await websocket.close(code=4003)
-                 return
-        else:
-            if not REMODASH_TOKEN or not token or token != REMODASH_TOKEN:
-                await websocket.close(code=4003)
-                return
+    if _authenticate(token, key) is None:
+        await websocket.close(code=4003)
+        return
 
     await websocket.accept()
 
@@ -2550,7 +3273,8 @@ async def terminal_stream_ws(sid: str, websocket: WebSocket, token: Optional[str
         session = LocalPTYSession(sid, cwd=cwd)
     else:
         session = WebTerminalSession(sid, cwd=cwd)
-    session.subscribers.add(websocket)
+    # Subscribing replays history first (captures startup messages/errors)
+    session.subscribe(websocket)
 
     # Optional Command Injection
     if command:
@@ -2558,14 +3282,39 @@ async def terminal_stream_ws(sid: str, websocket: WebSocket, token: Optional[str
         session.write_input(command + "\r\n")
 
     try:
-        # Send history (captures startup messages/errors)
-        for chunk in session.history:
-             await websocket.send_text(json.dumps({"type": "output", "data": chunk}))
-
         # Loop for input
         while True:
-            msg_text = await websocket.receive_text()
-            msg = json.loads(msg_text)
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                break
+
+            data = message.get("bytes")
+            if data:
+                frame_type = data[0]
+                if frame_type == TERM_FRAME_INPUT:
+                    session.write_input(data[1:].decode(errors="ignore"))
+                elif frame_type == TERM_FRAME_RESIZE and len(data) >= 5:
+                    cols, rows = struct.unpack_from(">HH", data, 1)
+                    session.resize(cols, rows)
+                continue
+
+            # Legacy JSON text frames
+            msg_text = message.get("text")
+            if not msg_text:
+                continue
+
+            if _term_msg_decoder:
+                try:
+                    msg = _term_msg_decoder.decode(msg_text)
+                except msgspec.ValidationError:
+                    continue # Unknown message type
+                if isinstance(msg, TermInputMsg):
+                    session.write_input(msg.data)
+                else:
+                    session.resize(msg.cols, msg.rows)
+                continue
+
+            msg = _json_loads(msg_text)
 
             if msg["type"] == "input":
                 session.write_input(msg["data"])
@@ -2582,6 +3331,64 @@ async def terminal_stream_ws(sid: str, websocket: WebSocket, token: Optional[str
 
 # --- File System Endpoints ---
 
+# list_files scans into plain tuple rows: (name, name_lower, path, is_dir, size, mtime).
+# name_lower is computed once per entry for sorting; dicts are only built once, after sorting.
+def _scan_directory(path) -> list:
+    """Tight scandir loop collecting one row per readable entry."""
+    rows = []
+    append = rows.append
+    with os.scandir(path) as it:
+        for entry in it:
+            try:
+                # Follows symlinks on purpose (linked dirs list as dirs). For regular
+                # entries this is the only syscall on Linux and none on Windows.
+                st = entry.stat()
+                name = entry.name
+                append((name, name.lower(), entry.path, entry.is_dir(), st.st_size, st.st_mtime))
+            except OSError:
+                continue # Skip permission denied etc
+    return rows
+
+# Primary sort keys for list_files rows, selected once per request (itemgetter runs in C).
+# "type" is constant within the dirs/files partitions, so it reduces to the name key;
+# equal sizes/dates fall back to the lowercased name, so ties are deterministic.
+_LIST_SORT_KEYS = {
+    "name": itemgetter(1),
+    "size": itemgetter(4, 1),
+    "date": itemgetter(5, 1),
+    "type": itemgetter(1),
+}
+
+@functools.lru_cache(maxsize=64)
+def _cached_listing(path: str, mtime_ns: int, sort_by: str, order: str) -> list:
+    """
+    Scanned and sorted list_files items, keyed on the directory's mtime_ns.
+    Adding, removing or renaming entries bumps the directory mtime and misses the cache.
+    In-place edits to existing files do not, so their size/mtime can lag until the
+    directory changes; our own mutations (save/upload/copy/extract/mkdir/delete/rename) clear the cache,
+    which also covers filesystems whose coarse mtimes (FAT/exFAT) miss a change.
+    """
+    rows = _scan_directory(path)
+
+    # Directories always come first; `order` only flips the order within each group.
+    # Partition once, then sort each group on its own (no dirs-first sort pass).
+    primary = _LIST_SORT_KEYS.get(sort_by, _LIST_SORT_KEYS["name"])
+    reverse = (order == "desc")
+    dirs = [r for r in rows if r[3]]
+    files = [r for r in rows if not r[3]]
+    dirs.sort(key=primary, reverse=reverse)
+    files.sort(key=primary, reverse=reverse)
+    rows = dirs + files
+
+    return [
+        {"name": name, "path": p, "type": "dir" if is_dir else "file", "size": size, "mtime": mtime}
+        for name, _, p, is_dir, size, mtime in rows
+    ]
+
+def _list_directory(path: str, sort_by: str, order: str) -> list:
+    st = os.stat(path)
+    return _cached_listing(path, st.st_mtime_ns, sort_by, order)
+
 @app.get("/api/files/list", dependencies=[Depends(verify_token)])
 async def list_files(path: str, sort_by: str = "name", order: str = "asc"):
     """Lists files in the given directory with sorting."""
@@ -2591,87 +3398,20 @@ async def list_files(path: str, sort_by: str = "name", order: str = "asc"):
     if not target_path.is_dir():
          raise HTTPException(status_code=400, detail="Path is not a directory")
 
-    items = []
     try:
-        with os.scandir(target_path) as it:
-            for entry in it:
-                try:
-                    stat = entry.stat()
-                    item_type = "dir" if entry.is_dir() else "file"
-                    items.append({
-                        "name": entry.name,
-                        "path": entry.path,
-                        "type": item_type,
-                        "size": stat.st_size,
-                        "mtime": stat.st_mtime
-                    })
-                except OSError:
-                    continue # Skip permission denied etc
+        # scandir + per-entry stat can be slow on network mounts; keep it off the event loop
+        items = await asyncio.to_thread(_list_directory, str(target_path), sort_by, order)
     except PermissionError:
         raise HTTPException(status_code=403, detail="Permission Denied")
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    # Correct Single-Pass Sorting
-    reverse = (order == "desc")
-
-    # Python sort is stable. We want directories first always.
-    # We construct a tuple for key: (is_not_directory, sort_field)
-    # is_not_directory: 0 for dir, 1 for file. So dirs come first.
-
-    def sort_key(x):
-        is_file = 1 if x["type"] == "file" else 0
-        val = x["name"].lower()
-
-        if sort_by == "size":
-            val = x["size"]
-        elif sort_by == "date":
-            val = x["mtime"]
-        elif sort_by == "type":
-            val = (x["type"], x["name"].lower())
-
-        return (is_file, val)
-
-    items.sort(key=sort_key, reverse=reverse)
-
-    # However, 'reverse' applies to the whole tuple.
-    # Usually users want "Dirs First" regardless of sort order.
-    # So if we reverse, files might come first.
-    # Let's fix that.
-
-    if reverse:
-        # If reverse=True, we want Z-A but still Dirs First.
-        # So we can't just use one key with reverse=True if we want Dirs First fixed.
-        # Strategy: Sort by main criteria, then stable sort by Type.
+    # Pre-serialized response skips jsonable_encoder walking every item
+    return FastJSONResponse(content={"path": str(target_path), "items": items})
 
-        # 1. Sort by content (reversed)
-        if sort_by == "name":
-            items.sort(key=lambda x: x["name"].lower(), reverse=True)
-        elif sort_by == "size":
-            items.sort(key=lambda x: x["size"], reverse=True)
-        elif sort_by == "date":
-            items.sort(key=lambda x: x["mtime"], reverse=True)
-        elif sort_by == "type":
-             items.sort(key=lambda x: (x["type"], x["name"].lower()), reverse=True)
-
-        # 2. Stable sort by Type (Dirs first = 0, Files = 1)
-        items.sort(key=lambda x: 0 if x["type"] == "dir" else 1)
-
-    else:
-        # Ascending
-        if sort_by == "name":
-            items.sort(key=lambda x: x["name"].lower())
-        elif sort_by == "size":
-            items.sort(key=lambda x: x["size"])
-        elif sort_by == "date":
-            items.sort(key=lambda x: x["mtime"])
-        elif sort_by == "type":
-             items.sort(key=lambda x: (x["type"], x["name"].lower()))
-
-        # Stable sort by Type
-        items.sort(key=lambda x: 0 if x["type"] == "dir" else 1)
-
-    return {"path": str(target_path), "items": items}
+class _LargeFileResponse(FileResponse):
+    """FileResponse that reads 1 MiB per send, for media-sized files."""
+    chunk_size = 1 << 20
 
 @app.get("/api/files/content", dependencies=[Depends(verify_token)])
 async def get_file_content(path: str):
@@ -2679,29 +3419,62 @@ async def get_file_content(path: str):
     if not p.is_file():
         raise HTTPException(status_code=404, detail="File not found")
     try:
-        # Read as text, binary handling might be needed later for other types
-        # For now assuming text editing as per requirement
-        with open(p, "r", encoding="utf-8", errors="ignore") as f:
-             content = f.read()
-        return {"content": content}
+        async with aiofiles.open(p, "rb") as f:
+            head = await f.read(8192)
+            if b"\x00" in head:
+                # Binary: serve the bytes as-is instead of mangling them through a text decode
+                return _LargeFileResponse(p, filename=p.name)
+            raw = head + await f.read()
+        return {"content": raw.decode("utf-8", errors="replace")}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def _fast_rmtree(root: str):
+    """Iterative delete: one scandir pass per directory, then rmdir deepest-first."""
+    stack = [root]
+    dirs = []
+    while stack:
+        d = stack.pop()
+        dirs.append(d)
+        with os.scandir(d) as it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    stack.append(e.path)
+                else:
+                    os.unlink(e.path)
+    for d in reversed(dirs):
+        os.rmdir(d)
+
+def _weak_etag(st: os.stat_result) -> str:
+    return f'W/"{st.st_ino:x}-{st.st_size:x}-{st.st_mtime_ns:x}"'
+
 @app.get("/api/files/view", dependencies=[Depends(verify_token)])
-async def view_file(path: str):
+async def view_file(path: str, request: Request):
     """Serves a file for viewing (e.g. images)."""
     p = check_path_access(path)
-    if not p.is_file():
+    try:
+        st = os.stat(p)
+    except OSError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         raise HTTPException(status_code=404, detail="File not found")
 
-    return FileResponse(p, filename=p.name)
+    # Revalidation: unchanged files answer 304 with no body
+    etag = _weak_etag(st)
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=60"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag in [t.strip() for t in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    return _LargeFileResponse(p, filename=p.name, headers=headers, stat_result=st)
 
 @app.post("/api/files/save", dependencies=[Depends(verify_token)])
 async def save_file_content(data: FileOpRequest):
     p = check_path_access(data.path)
     try:
-        with open(p, "w", encoding="utf-8") as f:
-            f.write(data.content if data.content else "")
+        async with aiofiles.open(p, "w", encoding="utf-8") as f:
+            await f.write(data.content if data.content else "")
+        _cached_listing.cache_clear()
         return {"success": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -2710,7 +3483,8 @@ async def save_file_content(data: FileOpRequest):
 async def create_folder(data: FileOpRequest):
     p = check_path_access(data.path)
     try:
-        p.mkdir(parents=True, exist_ok=True)
+        os.makedirs(p, exist_ok=True)
+        _cached_listing.cache_clear()
         return {"success": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -2718,13 +3492,14 @@ async def create_folder(data: FileOpRequest):
 @app.post("/api/files/delete", dependencies=[Depends(verify_token)])
 async def delete_item(data: FileOpRequest):
     p = check_path_access(data.path)
-    if not p.exists():
+    if not os.path.exists(p):
         raise HTTPException(status_code=404, detail="Path not found")
     try:
-        if p.is_dir():
-            shutil.rmtree(p)
+        if os.path.isdir(p):
+            await asyncio.to_thread(_fast_rmtree, str(p))
         else:
-            p.unlink()
+            os.unlink(p)
+        _cached_listing.cache_clear()
         return {"success": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -2744,7 +3519,8 @@ async def rename_item(data: FileOpRequest):
         # Validate Access for Destination
         check_path_access(str(dst))
 
-        src.rename(dst)
+        os.rename(src, dst)
+        _cached_listing.cache_clear()
         return {"success": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -2771,10 +3547,35 @@ async def copy_item(data: FileOpRequest):
             # Ensure parent directory exists
             dst.parent.mkdir(parents=True, exist_ok=True)
             shutil.copy2(src, dst)
+        _cached_listing.cache_clear()
         return {"success": True}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+def _copy_upload(src, dest: Path):
+    """
+    Writes an upload's spool file to dest. Once the spool has rolled over to
+    disk the kernel copies it with sendfile; small in-memory uploads and
+    platforms without sendfile fall back to 1 MiB buffered copies.
+    """
+    with open(dest, "wb") as out:
+        # Asking an in-memory spool for its fileno would force it onto disk first
+        try:
+            in_memory = isinstance(src._file, io.BytesIO)
+        except AttributeError:
+            in_memory = isinstance(src, io.BytesIO)
+        if hasattr(os, "sendfile") and not in_memory:
+            try:
+                in_fd = src.fileno()
+                offset = src.tell()
+                while sent := os.sendfile(out.fileno(), in_fd, offset, 1 << 30):
+                    offset += sent
+                return
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                out.seek(0)
+                out.truncate()
+        shutil.copyfileobj(src, out, 1 << 20)
+
 @app.post("/api/files/upload", dependencies=[Depends(verify_token)])
 async def upload_files(path: str = Form(...), files: List[UploadFile] = File(...)):
     """Uploads multiple files to the specified path."""
@@ -2792,17 +3593,79 @@ async def upload_files(path: str = Form(...), files: List[UploadFile] = File(...
             # Security check: ensure final path is still within jail if applicable
             # (Already covered by check_path_access(path) + normal path join, but good to be safe)
 
-            with open(file_path, "wb") as f:
-                shutil.copyfileobj(file.file, f)
+            await run_in_threadpool(_copy_upload, file.file, file_path)
             results.append(file.filename)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        _cached_listing.cache_clear()
 
     return {"success": True, "uploaded": results}
 
+class _QueueWriter(io.RawIOBase):
+    """
+    Unseekable sink for zipfile running in a worker thread. Written bytes are
+    handed to the event loop in ~64 KiB chunks through a bounded queue, so a
+    slow client applies backpressure to the archiver.
+    """
+    CHUNK = 64 * 1024
+
+    def __init__(self, loop, queue: asyncio.Queue, cancelled: threading.Event):
+        self._loop = loop
+        self._queue = queue
+        self._cancelled = cancelled
+        self._buf = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, b):
+        if self._cancelled.is_set():
+            raise OSError("Client disconnected")
+        self._buf += b
+        if len(self._buf) >= self.CHUNK:
+            self._put(bytes(self._buf))
+            self._buf.clear()
+        return len(b)
+
+    def _put(self, item):
+        asyncio.run_coroutine_threadsafe(self._queue.put(item), self._loop).result()
+
+    def finish(self):
+        if self._buf and not self._cancelled.is_set():
+            self._put(bytes(self._buf))
+            self._buf.clear()
+
+    def end(self):
+        if not self._cancelled.is_set():
+            self._put(None)
+
+def _walk_files(root: Path):
+    """
+    Yields (path, arcname) for every regular file under root, with arcnames
+    starting at root's own name. Like os.walk it does not descend into
+    symlinked directories and skips directories it cannot read.
+    """
+    stack = [(str(root), root.name)]
+    while stack:
+        d, prefix = stack.pop()
+        try:
+            with os.scandir(d) as it:
+                for e in it:
+                    arcname = f"{prefix}/{e.name}" if prefix else e.name
+                    try:
+                        if e.is_dir(follow_symlinks=False):
+                            stack.append((e.path, arcname))
+                        elif e.is_file():
+                            yield e.path, arcname
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
 @app.post("/api/files/zip", dependencies=[Depends(verify_token)])
-async def download_zip(req: FilesListRequest, background_tasks: BackgroundTasks):
-    """Creates a temporary zip of requested files/folders and serves it."""
+async def download_zip(req: FilesListRequest):
+    """Zips the requested files/folders on the fly and streams the archive."""
     if not req.paths:
         raise HTTPException(status_code=400, detail="No paths provided")
 
@@ -2817,31 +3680,54 @@ async def download_zip(req: FilesListRequest, background_tasks: BackgroundTasks)
     if not valid_paths:
         raise HTTPException(status_code=400, detail="No valid paths found")
 
-    try:
-        # Create temp file
-        # We use delete=False so we can serve it, then cleanup in background task
-        fd, temp_path = tempfile.mkstemp(suffix=".zip")
-        os.close(fd)
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=8)
+    cancelled = threading.Event()
 
-        with zipfile.ZipFile(temp_path, "w", zipfile.ZIP_DEFLATED) as zf:
-            for p in valid_paths:
-                if p.is_file():
-                    zf.write(p, arcname=p.name)
-                elif p.is_dir():
-                    # Recursive add
-                    parent_len = len(str(p.parent))
-                    for root, dirs, files in os.walk(p):
-                        for file in files:
-                            abs_path = Path(root) / file
-                            # Relative path inside zip
-                            rel_path = str(abs_path)[parent_len:].strip(os.sep)
-                            zf.write(abs_path, arcname=rel_path)
-
-        background_tasks.add_task(os.unlink, temp_path)
-        return FileResponse(temp_path, filename="archive.zip", media_type="application/zip")
+    def produce():
+        # zipfile writes data descriptors when the output isn't seekable
+        sink = _QueueWriter(loop, queue, cancelled)
+        try:
+            with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED, strict_timestamps=False) as zf:
+                def add(path, arcname):
+                    try:
+                        zf.write(path, arcname=arcname)
+                    except OSError:
+                        if cancelled.is_set():
+                            raise
+                        # Unreadable or vanished since the walk: skip it, like _walk_files does
+                for p in valid_paths:
+                    if p.is_file():
+                        add(p, p.name)
+                    elif p.is_dir():
+                        for abs_path, arcname in _walk_files(p):
+                            add(abs_path, arcname)
+        finally:
+            # The 200 is already out, so always close the archive cleanly
+            sink.finish()
+            sink.end()
 
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    async def body():
+        producer = asyncio.ensure_future(asyncio.to_thread(produce))
+        try:
+            while True:
+                chunk = await queue.get()
+                if chunk is None:
+                    break
+                yield chunk
+            await producer
+        finally:
+            if not producer.done():
+                # Client went away: stop the archiver and unblock a pending put
+                cancelled.set()
+                while not queue.empty():
+                    queue.get_nowait()
+
+    return StreamingResponse(
+        body(),
+        media_type="application/zip",
+        headers={"Content-Disposition": 'attachment; filename="archive.zip"'}
+    )
 
 @app.post("/api/files/archive", dependencies=[Depends(verify_token)])
 async def archive_files(req: ArchiveRequest):
@@ -2867,7 +3753,7 @@ async def archive_files(req: ArchiveRequest):
         # Ensure parent directory exists
         dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with zipfile.ZipFile(dest_path, "w", zipfile.ZIP_DEFLATED) as zf:
+        with zipfile.ZipFile(dest_path, "w", zipfile.ZIP_DEFLATED, strict_timestamps=False) as zf:
             for p in valid_paths:
                 if p.is_file():
                     zf.write(p, arcname=p.name)
@@ -2897,15 +3783,17 @@ async def extract_archive(req: ExtractRequest):
         dest = check_path_access(req.destination)
 
         # Security: check zip entries against zip slip vulnerability
+        dest_root = (_root_pair(dest),)
         with zipfile.ZipFile(src, "r") as zf:
             for member in zf.infolist():
                 member_path = dest / member.filename
                 # Ensure the resolved member path is under the destination path
-                if not os.path.commonpath([str(dest.resolve()), str(member_path.resolve())]).startswith(str(dest.resolve())):
+                if not _within_roots(member_path.resolve(), dest_root):
                      raise HTTPException(status_code=400, detail="Zip Slip attempt detected")
 
             zf.extractall(dest)
 
+        _cached_listing.cache_clear()
         return {"success": True}
 
     except Exception as e:
@@ -2923,11 +3811,27 @@ async def list_log_sessions():
 
 @app.get("/api/logs/sessions/{session_id}/chunks", dependencies=[Depends(verify_token)])
 async def list_log_chunks(session_id: str):
-    return logger.list_chunks(session_id)
+    return FastJSONResponse(content=logger.list_chunks(session_id))
 
 @app.get("/api/logs/sessions/{session_id}/chunks/{chunk_id}", dependencies=[Depends(verify_token)])
 async def get_log_chunk(session_id: str, chunk_id: str):
-    return logger.get_chunk_content(session_id, chunk_id)
+    async def body():
+        # Stream the JSON array instead of buffering the whole chunk
+        yield b"["
+        sep = b""
+        async for entry in logger.get_chunk_content(session_id, chunk_id):
+            yield sep + _json_dumpb(entry)
+            sep = b","
+        yield b"]"
+    return StreamingResponse(body(), media_type="application/json")
+
+@app.get("/api/logs/sessions/{session_id}/chunks/{chunk_id}/raw", dependencies=[Depends(verify_token)])
+async def get_log_chunk_raw(session_id: str, chunk_id: str):
+    """Serves a chunk as stored (NDJSON, epoch `ts`) with Range support for tailing."""
+    path = logger.chunk_path(session_id, chunk_id)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Chunk not found")
+    return FileResponse(path, media_type="application/x-ndjson")
 
 @app.get("/api/modules", dependencies=[Depends(verify_token)])
 async def list_modules():
@@ -2969,7 +3873,7 @@ async def save_config(data: Dict[str, Any]):
         except Exception as e:
             print(f"Failed to save port: {e}")
 
-    settings_manager.save_settings()
+    await asyncio.to_thread(settings_manager.save_settings)
     return {"success": True, "message": "Settings saved."}
 
 # Serve dashboard at root
@@ -3031,4 +3935,5 @@ if __name__ == "__main__":
         print(f"Failed to load port.txt: {e}")
 
     print(f"Starting RemoDash server on port {port}...")
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # loop/http "auto" pick uvloop and httptools when installed (not on Windows)
+    uvicorn.run(app, host="0.0.0.0", port=port, loop="auto", http="auto")
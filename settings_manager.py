@@ -1,6 +1,9 @@
 import os
 import json
 import shutil
+import asyncio
+import atexit
+import threading
 from pathlib import Path
 
 # Script directory and settings path
@@ -10,24 +13,64 @@ SETTINGS_PATH = os.path.join(SCRIPT_DIR, "settings.json")
 class SettingsManager:
     """Enhanced settings manager with UI preferences for RemoDash"""
 
-    def __init__(self):
+    def __init__(self, save_delay: float = 0.5):
         self.settings = None
         self.first_boot = False
+        self.save_delay = save_delay
+        self._dirty = False
+        self._save_handle = None
+        self._loop = None
+        self._flush_task = None
+        # Saves can come from the loop, the atexit hook and the restart/shutdown threads
+        self._write_lock = threading.Lock()
+        self._backed_up = False
         self.ui_settings = {
             "font_size": 12,
             "window_size": "1400x900",
             "confirmation_preferences": {}
         }
         self.load_or_detect_first_boot()
+        atexit.register(self.flush)
 
     def get_setting(self, key: str, default: any = None) -> any:
         """Gets a setting from the UI settings."""
         return self.ui_settings.get(key, default)
 
     def set_setting(self, key: str, value: any):
-        """Sets a setting in the UI settings and saves it."""
+        """Sets a setting in the UI settings and schedules a save."""
         self.ui_settings[key] = value
-        self.save_settings()
+        self.schedule_save()
+
+    def schedule_save(self):
+        """Coalesces bursts of changes into one write; writes immediately when no event loop is running."""
+        self._dirty = True
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        if self._save_handle is None:
+            self._loop = loop
+            self._save_handle = loop.call_later(self.save_delay, self._start_flush)
+
+    def _start_flush(self):
+        # The write ends in an fsync, which can take a while on SD cards; keep it off the loop
+        self._save_handle = None
+        self._flush_task = asyncio.create_task(asyncio.to_thread(self.flush))
+
+    def _cancel_pending_save(self):
+        handle, self._save_handle = self._save_handle, None
+        if handle is not None:
+            # TimerHandle.cancel isn't thread-safe; hand it to the loop that owns it
+            try:
+                self._loop.call_soon_threadsafe(handle.cancel)
+            except RuntimeError:
+                pass # Loop already closed
+
+    def flush(self):
+        """Writes pending changes now (also called on shutdown)."""
+        if self._dirty:
+            self.save_settings()
 
     def load_or_detect_first_boot(self):
         """Load settings or create a default one on first boot."""
@@ -131,24 +174,34 @@ class SettingsManager:
         }
 
     def save_settings(self, settings: dict = None):
-        """Save settings and UI preferences to JSON file"""
-        try:
-            if os.path.exists(SETTINGS_PATH):
-                backup_path = SETTINGS_PATH + '.bk'
-                shutil.copy2(SETTINGS_PATH, backup_path)
-
-            data = {
-                "settings": settings or self.settings,
-                "ui_settings": self.ui_settings
-            }
-
-            with open(SETTINGS_PATH, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-
-            if settings:
-                self.settings = settings
-            self.first_boot = False
-            print("Settings saved successfully")
+        """Save settings and UI preferences to JSON file. Safe to call from any thread."""
+        with self._write_lock:
+            # Supersedes any pending scheduled save
+            self._dirty = False
+            self._cancel_pending_save()
+            try:
+                # Keep the file as it was at startup; later saves replace it atomically
+                if not self._backed_up and os.path.exists(SETTINGS_PATH):
+                    backup_path = SETTINGS_PATH + '.bk'
+                    shutil.copy2(SETTINGS_PATH, backup_path)
+                self._backed_up = True
+
+                data = {
+                    "settings": settings or self.settings,
+                    "ui_settings": self.ui_settings
+                }
+
+                tmp_path = SETTINGS_PATH + '.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_path, SETTINGS_PATH)
+
+                if settings:
+                    self.settings = settings
+                self.first_boot = False
+                print("Settings saved successfully")
 
-        except Exception as e:
-            print(f"Error saving settings: {e}")
+            except Exception as e:
+                print(f"Error saving settings: {e}")
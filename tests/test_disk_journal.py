@@ -0,0 +1,153 @@
+import asyncio
+import datetime
+import json
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from server import DiskJournalLogger
+
+
+def read_session(logger):
+    session_id = logger.current_session_dir.name
+
+    async def collect():
+        events = []
+        for chunk in logger.list_chunks(session_id):
+            async for entry in logger.get_chunk_content(session_id, chunk["id"]):
+                events.append(entry)
+        return events
+
+    return asyncio.run(collect())
+
+
+def test_emit_without_flusher_writes_immediately(tmp_path):
+    logger = DiskJournalLogger(log_dir=str(tmp_path))
+
+    asyncio.run(logger.emit("Info", "hello", "Test"))
+
+    events = read_session(logger)
+    assert [e["msg"] for e in events] == ["hello"]
+    assert events[0]["level"] == "Info"
+    assert events[0]["source"] == "Test"
+
+
+def test_idle_session_creates_no_chunk(tmp_path):
+    logger = DiskJournalLogger(log_dir=str(tmp_path))
+    assert logger.current_session_dir.is_dir()
+    assert logger.list_chunks(logger.current_session_dir.name) == []
+
+
+def test_flusher_batches_and_rotates(tmp_path):
+    logger = DiskJournalLogger(log_dir=str(tmp_path), chunk_bytes=500)
+
+    async def scenario():
+        logger.start()
+        for i in range(25):
+            await logger.emit("Info", f"msg {i}", "Test")
+            if i % 5 == 4:
+                # Let the flusher write this burst as one batch
+                await asyncio.sleep(0.05)
+        await logger.stop()
+
+    asyncio.run(scenario())
+
+    events = read_session(logger)
+    assert [e["msg"] for e in events] == [f"msg {i}" for i in range(25)]
+    chunks = logger.list_chunks(logger.current_session_dir.name)
+    assert len(chunks) >= 2
+    assert all(c["size"] > 0 for c in chunks)
+
+
+class FakeRequest:
+    def __init__(self, headers=None):
+        self.headers = headers or {}
+
+    async def is_disconnected(self):
+        return False
+
+
+def test_slow_subscriber_drops_oldest_without_blocking_emit(tmp_path):
+    logger = DiskJournalLogger(log_dir=str(tmp_path), subscriber_queue_size=2)
+
+    async def scenario():
+        stream = logger.subscribe(FakeRequest())
+        await stream.__anext__()  # connected message
+        for i in range(5):
+            await asyncio.wait_for(logger.emit("Info", f"msg {i}", "Test"), timeout=1)
+        received = [await stream.__anext__() for _ in range(2)]
+        await stream.aclose()
+        return received
+
+    received = asyncio.run(scenario())
+    assert [json.loads(e["data"])["msg"] for e in received] == ["msg 3", "msg 4"]
+    assert logger.drops == 3
+    assert logger._subs == ()
+
+
+def test_disk_stores_epoch_and_api_returns_iso(tmp_path):
+    logger = DiskJournalLogger(log_dir=str(tmp_path))
+
+    asyncio.run(logger.emit("Info", "hello", "Test"))
+
+    raw = logger.current_chunk_path.read_text(encoding="utf-8")
+    assert isinstance(json.loads(raw.splitlines()[0])["ts"], float)
+    events = read_session(logger)
+    assert datetime.datetime.fromisoformat(events[0]["ts"])
+
+
+def test_reconnect_replays_missed_events(tmp_path):
+    logger = DiskJournalLogger(log_dir=str(tmp_path), chunk_bytes=300)
+
+    async def scenario():
+        logger.start()
+        for i in range(3):
+            await logger.emit("Info", f"seen {i}", "Test")
+        await logger.flush()
+        last_id = f"{logger.current_session_dir.name}:3"
+        for i in range(10):
+            await logger.emit("Info", f"missed {i}", "Test")
+
+        stream = logger.subscribe(FakeRequest({"last-event-id": last_id}))
+        await stream.__anext__()  # connected message
+        replayed = [await stream.__anext__() for _ in range(10)]
+        await logger.emit("Info", "live", "Test")
+        live = await stream.__anext__()
+        await stream.aclose()
+        await logger.stop()
+        return replayed, live
+
+    replayed, live = asyncio.run(scenario())
+    assert [json.loads(e["data"])["msg"] for e in replayed] == [f"missed {i}" for i in range(10)]
+    assert replayed[-1]["id"].endswith(":13")
+    assert json.loads(live["data"])["msg"] == "live"
+    assert live["id"].endswith(":14")
+    assert len(logger.list_chunks(logger.current_session_dir.name)) >= 2
+
+
+def test_raw_chunk_endpoint_supports_range(tmp_path, monkeypatch):
+    from fastapi.testclient import TestClient
+    import server
+
+    logger = DiskJournalLogger(log_dir=str(tmp_path))
+    asyncio.run(logger.emit("Info", "hello", "Test"))
+    monkeypatch.setattr(server, "logger", logger)
+    monkeypatch.setattr(server, "REMODASH_TOKEN", "test-token")
+
+    client = TestClient(server.app)
+    headers = {"X-Token": "test-token"}
+    session_id = logger.current_session_dir.name
+    url = f"/api/logs/sessions/{session_id}/chunks/chunk_001.log/raw"
+    raw = logger.current_chunk_path.read_bytes()
+
+    res = client.get(url, headers=headers)
+    assert res.status_code == 200
+    assert res.headers["content-type"] == "application/x-ndjson"
+    assert res.content == raw
+
+    res = client.get(url, headers={**headers, "Range": "bytes=5-"})
+    assert res.status_code == 206
+    assert res.content == raw[5:]
+
+    res = client.get(f"/api/logs/sessions/{session_id}/chunks/..%2Fsecret.log/raw", headers=headers)
+    assert res.status_code == 404
@@ -0,0 +1,344 @@
+import asyncio
+import json
+import os
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import server
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def listing(path, sort_by="name", order="asc"):
+    res = run(server.list_files(str(path), sort_by=sort_by, order=order))
+    return json.loads(res.body)
+
+
+def make_tree(tmp_path: Path):
+    (tmp_path / "beta").mkdir()
+    (tmp_path / "Alpha").mkdir()
+    (tmp_path / "c.txt").write_text("x" * 30, encoding="utf-8")
+    (tmp_path / "a.txt").write_text("x" * 10, encoding="utf-8")
+    (tmp_path / "B.md").write_text("x" * 20, encoding="utf-8")
+    os.utime(tmp_path / "a.txt", (1000, 3000))
+    os.utime(tmp_path / "B.md", (1000, 1000))
+    os.utime(tmp_path / "c.txt", (1000, 2000))
+
+
+def names(data):
+    return [i["name"] for i in data["items"]]
+
+
+def test_list_files_dirs_first_by_name(tmp_path):
+    server.settings_manager.settings["filesystem_mode"] = "open"
+    make_tree(tmp_path)
+
+    data = listing(tmp_path)
+    assert data["path"] == str(tmp_path.resolve())
+    assert names(data) == ["Alpha", "beta", "a.txt", "B.md", "c.txt"]
+
+    data = listing(tmp_path, order="desc")
+    assert names(data) == ["beta", "Alpha", "c.txt", "B.md", "a.txt"]
+
+
+def test_list_files_sort_by_size_and_date(tmp_path):
+    server.settings_manager.settings["filesystem_mode"] = "open"
+    make_tree(tmp_path)
+
+    files = [n for n in names(listing(tmp_path, sort_by="size")) if "." in n]
+    assert files == ["a.txt", "B.md", "c.txt"]
+
+    files = [n for n in names(listing(tmp_path, sort_by="date", order="desc")) if "." in n]
+    assert files == ["a.txt", "c.txt", "B.md"]
+
+
+def test_list_files_item_fields(tmp_path):
+    server.settings_manager.settings["filesystem_mode"] = "open"
+    make_tree(tmp_path)
+
+    items = {i["name"]: i for i in listing(tmp_path)["items"]}
+    assert items["Alpha"]["type"] == "dir"
+    assert items["c.txt"]["type"] == "file"
+    assert items["c.txt"]["size"] == 30
+    assert items["c.txt"]["mtime"] == 2000
+    assert items["c.txt"]["path"] == str(tmp_path.resolve() / "c.txt")
+
+
+def test_list_files_cache_invalidation(tmp_path):
+    server.settings_manager.settings["filesystem_mode"] = "open"
+    make_tree(tmp_path)
+    assert "new.txt" not in names(listing(tmp_path))
+
+    # New entries bump the directory mtime
+    (tmp_path / "new.txt").write_text("new", encoding="utf-8")
+    assert "new.txt" in names(listing(tmp_path))
+
+    # In-place saves through the API clear the cache
+    run(server.save_file_content(server.FileOpRequest(path=str(tmp_path / "a.txt"), content="y" * 50)))
+    items = {i["name"]: i for i in listing(tmp_path)["items"]}
+    assert items["a.txt"]["size"] == 50
+
+
+def test_create_rename_delete(tmp_path):
+    server.settings_manager.settings["filesystem_mode"] = "open"
+
+    folder = tmp_path / "one" / "two"
+    run(server.create_folder(server.FileOpRequest(path=str(folder))))
+    assert folder.is_dir()
+
+    f = folder / "note.txt"
+    f.write_text("hi", encoding="utf-8")
+    run(server.rename_item(server.FileOpRequest(path=str(f), new_path="renamed.txt")))
+    assert not f.exists()
+    assert (folder / "renamed.txt").read_text(encoding="utf-8") == "hi"
+
+    run(server.delete_item(server.FileOpRequest(path=str(folder / "renamed.txt"))))
+    assert not (folder / "renamed.txt").exists()
+
+    run(server.delete_item(server.FileOpRequest(path=str(tmp_path / "one"))))
+    assert not (tmp_path / "one").exists()
+
+
+def test_view_file_etag_revalidation(tmp_path):
+    from fastapi.testclient import TestClient
+
+    server.settings_manager.settings["filesystem_mode"] = "open"
+    f = tmp_path / "img.png"
+    f.write_bytes(b"\x89PNG" + b"\x00" * 64)
+
+    client = TestClient(server.app)
+    headers = {"X-Token": "test-token"}
+    server.REMODASH_TOKEN = "test-token"
+
+    res = client.get("/api/files/view", params={"path": str(f)}, headers=headers)
+    assert res.status_code == 200
+    assert res.content == f.read_bytes()
+    etag = res.headers["etag"]
+
+    res = client.get("/api/files/view", params={"path": str(f)}, headers={**headers, "If-None-Match": etag})
+    assert res.status_code == 304
+    assert res.content == b""
+
+    f.write_bytes(b"\x89PNG" + b"\x01" * 80)
+    res = client.get("/api/files/view", params={"path": str(f)}, headers={**headers, "If-None-Match": etag})
+    assert res.status_code == 200
+
+
+def test_delete_tree_keeps_symlink_targets(tmp_path):
+    server.settings_manager.settings["filesystem_mode"] = "open"
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "keep.txt").write_text("keep", encoding="utf-8")
+
+    tree = tmp_path / "tree"
+    (tree / "a" / "b" / "c").mkdir(parents=True)
+    (tree / "a" / "b" / "c" / "deep.txt").write_text("x", encoding="utf-8")
+    (tree / "a" / "top.txt").write_text("x", encoding="utf-8")
+    os.symlink(outside, tree / "a" / "link")
+
+    run(server.delete_item(server.FileOpRequest(path=str(tree))))
+    assert not tree.exists()
+    assert (outside / "keep.txt").exists()
+
+
+def test_list_files_sort_by_type(tmp_path):
+    server.settings_manager.settings["filesystem_mode"] = "open"
+    make_tree(tmp_path)
+
+    assert names(listing(tmp_path, sort_by="type")) == ["Alpha", "beta", "a.txt", "B.md", "c.txt"]
+    assert names(listing(tmp_path, sort_by="type", order="desc")) == ["beta", "Alpha", "c.txt", "B.md", "a.txt"]
+
+
+def test_gzip_listing_but_not_file_view(tmp_path):
+    from fastapi.testclient import TestClient
+
+    server.settings_manager.settings["filesystem_mode"] = "open"
+    for i in range(50):
+        (tmp_path / f"file_{i:03d}.txt").write_text("x" * 2000, encoding="utf-8")
+
+    client = TestClient(server.app)
+    server.REMODASH_TOKEN = "test-token"
+    headers = {"X-Token": "test-token", "Accept-Encoding": "gzip"}
+
+    res = client.get("/api/files/list", params={"path": str(tmp_path)}, headers=headers)
+    assert res.status_code == 200
+    assert res.headers.get("content-encoding") == "gzip"
+    assert len(res.json()["items"]) == 50
+
+    res = client.get("/api/files/view", params={"path": str(tmp_path / "file_000.txt")}, headers=headers)
+    assert res.status_code == 200
+    assert "content-encoding" not in res.headers
+
+
+def test_file_content_text_and_binary(tmp_path):
+    server.settings_manager.settings["filesystem_mode"] = "open"
+    text = tmp_path / "notes.txt"
+    text.write_text("héllo\nworld\n", encoding="utf-8")
+    assert run(server.get_file_content(str(text))) == {"content": "héllo\nworld\n"}
+
+    blob = tmp_path / "blob.bin"
+    blob.write_bytes(b"\x7fELF\x00\x01\x02")
+    res = run(server.get_file_content(str(blob)))
+    assert isinstance(res, server.FileResponse)
+
+
+def test_list_files_size_ties_sort_by_name(tmp_path):
+    server.settings_manager.settings["filesystem_mode"] = "open"
+    for name in ["delta.txt", "Alpha.txt", "charlie.txt", "bravo.txt"]:
+        (tmp_path / name).write_text("same", encoding="utf-8")
+
+    assert names(listing(tmp_path, sort_by="size")) == ["Alpha.txt", "bravo.txt", "charlie.txt", "delta.txt"]
+    assert names(listing(tmp_path, sort_by="size", order="desc")) == ["delta.txt", "charlie.txt", "bravo.txt", "Alpha.txt"]
+
+
+def test_zip_download_streams_archive(tmp_path):
+    import io
+    import zipfile
+    from fastapi.testclient import TestClient
+
+    server.settings_manager.settings["filesystem_mode"] = "open"
+    make_tree(tmp_path)
+    (tmp_path / "Alpha" / "inner.bin").write_bytes(os.urandom(200_000))
+
+    client = TestClient(server.app)
+    server.REMODASH_TOKEN = "test-token"
+    res = client.post(
+        "/api/files/zip",
+        json={"paths": [str(tmp_path / "Alpha"), str(tmp_path / "a.txt")]},
+        headers={"X-Token": "test-token"},
+    )
+    assert res.status_code == 200
+    assert res.headers["content-type"] == "application/zip"
+
+    zf = zipfile.ZipFile(io.BytesIO(res.content))
+    assert zf.testzip() is None
+    assert sorted(zf.namelist()) == ["Alpha/inner.bin", "a.txt"]
+    assert zf.read("Alpha/inner.bin") == (tmp_path / "Alpha" / "inner.bin").read_bytes()
+
+
+def test_upload_small_and_spooled_files(tmp_path):
+    from fastapi.testclient import TestClient
+
+    server.settings_manager.settings["filesystem_mode"] = "open"
+    small = b"hello"
+    # Larger than the upload spool's in-memory limit, so it rolls over to disk
+    large = os.urandom(3 * 1024 * 1024)
+
+    client = TestClient(server.app)
+    server.REMODASH_TOKEN = "test-token"
+    res = client.post(
+        "/api/files/upload",
+        data={"path": str(tmp_path)},
+        files=[("files", ("small.txt", small)), ("files", ("large.bin", large))],
+        headers={"X-Token": "test-token"},
+    )
+    assert res.status_code == 200
+    assert res.json()["uploaded"] == ["small.txt", "large.bin"]
+    assert (tmp_path / "small.txt").read_bytes() == small
+    assert (tmp_path / "large.bin").read_bytes() == large
+
+
+def test_copy_upload_keeps_small_spool_in_memory(tmp_path, monkeypatch):
+    import io
+    import tempfile
+
+    spool = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+    spool.write(b"hello")
+    spool.seek(0)
+    # _rolled is private; without it the copy must still not ask for a
+    # fileno, which would roll the spool over to disk
+    del spool._rolled
+    monkeypatch.delattr(tempfile.SpooledTemporaryFile, "_rolled", raising=False)
+
+    def no_fileno():
+        raise AssertionError("in-memory spool rolled to disk")
+    spool.fileno = no_fileno
+
+    server._copy_upload(spool, tmp_path / "small.txt")
+    assert (tmp_path / "small.txt").read_bytes() == b"hello"
+    assert isinstance(spool._file, io.BytesIO)
+
+
+def test_walk_files_yields_nested_arcnames_and_skips_dir_links(tmp_path):
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (outside / "x.txt").write_text("x", encoding="utf-8")
+
+    root = tmp_path / "root"
+    (root / "a" / "b").mkdir(parents=True)
+    (root / "top.txt").write_text("t", encoding="utf-8")
+    (root / "a" / "b" / "deep.txt").write_text("d", encoding="utf-8")
+    os.symlink(outside, root / "a" / "dirlink")
+    os.symlink(root / "top.txt", root / "filelink.txt")
+
+    arcnames = sorted(arc for _, arc in server._walk_files(root))
+    assert arcnames == ["root/a/b/deep.txt", "root/filelink.txt", "root/top.txt"]
+
+
+def test_gzip_middleware_passes_sse_stream_through():
+    seen = {}
+
+    async def app(scope, receive, send):
+        seen[scope["path"]] = send
+
+    async def send(message):
+        pass
+
+    async def scenario():
+        middleware = server.SelectiveGZipMiddleware(app, minimum_size=1)
+        for path in ("/api/logs", "/api/files/list"):
+            scope = {"type": "http", "path": path, "headers": [(b"accept-encoding", b"gzip")]}
+            await middleware(scope, None, send)
+
+    run(scenario())
+    assert seen["/api/logs"] is send
+    assert seen["/api/files/list"] is not send
+
+
+def test_mutations_clear_listing_cache_on_coarse_mtime(tmp_path):
+    server.settings_manager.settings["filesystem_mode"] = "open"
+    make_tree(tmp_path)
+
+    def unchanged_mtime(op):
+        # FAT/exFAT can leave the directory mtime in the same 2 s tick
+        st = os.stat(tmp_path)
+        names(listing(tmp_path))
+        run(op)
+        os.utime(tmp_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        return names(listing(tmp_path))
+
+    assert "new" in unchanged_mtime(server.create_folder(server.FileOpRequest(path=str(tmp_path / "new"))))
+    assert "a2.txt" in unchanged_mtime(server.rename_item(server.FileOpRequest(path=str(tmp_path / "a.txt"), new_path="a2.txt")))
+    assert "c.txt" not in unchanged_mtime(server.delete_item(server.FileOpRequest(path=str(tmp_path / "c.txt"))))
+
+
+def test_zip_download_skips_unreadable_files(tmp_path, monkeypatch):
+    import io
+    import zipfile
+    from fastapi.testclient import TestClient
+
+    server.settings_manager.settings["filesystem_mode"] = "open"
+    make_tree(tmp_path)
+    write = zipfile.ZipFile.write
+
+    def flaky_write(self, filename, arcname=None, *args, **kwargs):
+        if arcname == "B.md":
+            raise PermissionError(13, "Permission denied", str(filename))
+        return write(self, filename, arcname, *args, **kwargs)
+
+    monkeypatch.setattr(zipfile.ZipFile, "write", flaky_write)
+
+    client = TestClient(server.app)
+    server.REMODASH_TOKEN = "test-token"
+    res = client.post(
+        "/api/files/zip",
+        json={"paths": [str(tmp_path / n) for n in ("a.txt", "c.txt", "B.md", "Alpha")]},
+        headers={"X-Token": "test-token"},
+    )
+    assert res.status_code == 200
+    zf = zipfile.ZipFile(io.BytesIO(res.content))
+    assert zf.testzip() is None
+    assert sorted(zf.namelist()) == ["a.txt", "c.txt"]
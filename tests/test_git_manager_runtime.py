@@ -228,3 +228,74 @@ def test_git_clone_endpoint_runtime_flow(tmp_path):
 
     repos = run(server.list_git_repos())
     assert any(r["path"] == str(clone_dest) for r in repos)
+
+
+def test_repo_cache_reuses_until_head_changes(tmp_path):
+    make_settings(tmp_path)
+    _, local_path, local_repo = create_remote_and_local(tmp_path)
+
+    with server._open_repo(str(local_path)) as first:
+        pass
+    with server._open_repo(str(local_path)) as second:
+        assert second is first
+
+    run(
+        server.git_checkout_branch(
+            server.GitBranchCheckoutRequest(path=str(local_path), branch="feature/x", create=True)
+        )
+    )
+    with server._open_repo(str(local_path)) as third:
+        assert third.active_branch.name == "feature/x"
+
+    status = run(server.get_git_status(str(local_path)))
+    assert status["branch"] == "feature/x"
+
+    status = run(server.get_git_status(str(tmp_path / "missing")))
+    assert status["branch"] == "Missing"
+
+
+def test_status_reports_porcelain_changes(tmp_path):
+    make_settings(tmp_path)
+    _, local_path, local_repo = create_remote_and_local(tmp_path)
+
+    (local_path / "new file.txt").write_text("new\n", encoding="utf-8")
+    local_repo.git.add("new file.txt")
+    (local_path / "docs").mkdir()
+    (local_path / "docs" / "a.md").write_text("a\n", encoding="utf-8")
+    local_repo.git.mv("README.md", "README.txt")
+
+    files = {f["file"]: f for f in run(server.get_git_status(str(local_path)))["files"]}
+    assert files["new file.txt"] == {"file": "new file.txt", "type": "added", "staged": True}
+    assert files["README.txt"]["type"] == "renamed"
+    assert files["docs/a.md"]["type"] == "untracked"
+
+    info = server._repo_info(str(local_path))
+    assert info["changed"] is True
+    assert info["branch"] == "master"
+
+
+def test_serialize_repo_shares_lock_across_symlinks_and_drops_idle_locks(tmp_path):
+    import os
+    from types import SimpleNamespace
+
+    server.settings_manager.settings["filesystem_mode"] = "open"
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    os.symlink(repo, tmp_path / "alias")
+    events = []
+
+    @server.serialize_repo
+    async def op(req):
+        events.append(("start", req.path))
+        await asyncio.sleep(0.05)
+        events.append(("end", req.path))
+
+    async def scenario():
+        await asyncio.gather(
+            op(SimpleNamespace(path=str(repo))),
+            op(SimpleNamespace(path=str(tmp_path / "alias" / "."))),
+        )
+
+    run(scenario())
+    assert [e[0] for e in events] == ["start", "end", "start", "end"]
+    assert len(server._REPO_WRITE_LOCKS) == 0
@@ -6,7 +6,7 @@ from pathlib import Path
 from fastapi.testclient import TestClient
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-from server import app, remo_media_manager
+from server import app, remo_media_manager, _NO_AUTH_CACHE
 
 client = TestClient(app)
 
@@ -23,6 +23,8 @@ def bypass_auth():
 
     with open(flag_file, "w") as f:
         f.write("1")
+    # Drop the cached flag lookup so the new file is seen immediately
+    _NO_AUTH_CACHE[0] = float("-inf")
 
     yield
 
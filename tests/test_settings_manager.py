@@ -0,0 +1,91 @@
+import asyncio
+import json
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import settings_manager as sm
+
+
+def make_manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(sm, "SETTINGS_PATH", str(tmp_path / "settings.json"))
+    manager = sm.SettingsManager(save_delay=0.05)
+    writes = []
+    save = manager.save_settings
+    monkeypatch.setattr(manager, "save_settings", lambda *a: (writes.append(1), save(*a)))
+    return manager, writes
+
+
+def test_set_setting_coalesces_writes(tmp_path, monkeypatch):
+    manager, writes = make_manager(tmp_path, monkeypatch)
+
+    async def scenario():
+        for i in range(10):
+            manager.set_setting("font_size", i)
+        assert writes == []
+        await asyncio.sleep(0.1)
+
+    asyncio.run(scenario())
+    assert len(writes) == 1
+    data = json.loads((tmp_path / "settings.json").read_text(encoding="utf-8"))
+    assert data["ui_settings"]["font_size"] == 9
+
+
+def test_flush_writes_pending_changes(tmp_path, monkeypatch):
+    manager, writes = make_manager(tmp_path, monkeypatch)
+
+    async def scenario():
+        manager.set_setting("font_size", 20)
+        manager.flush()
+        await asyncio.sleep(0.1)
+
+    asyncio.run(scenario())
+    assert len(writes) == 1
+    data = json.loads((tmp_path / "settings.json").read_text(encoding="utf-8"))
+    assert data["ui_settings"]["font_size"] == 20
+
+
+def test_save_replaces_file_and_backs_up_once(tmp_path, monkeypatch):
+    path = tmp_path / "settings.json"
+    path.write_text(json.dumps({"settings": {"git_repos": []}, "ui_settings": {"font_size": 1}}), encoding="utf-8")
+    original = path.read_text(encoding="utf-8")
+    manager, _ = make_manager(tmp_path, monkeypatch)
+
+    manager.set_setting("font_size", 2)
+    manager.set_setting("font_size", 3)
+
+    assert json.loads(path.read_text(encoding="utf-8"))["ui_settings"]["font_size"] == 3
+    assert (tmp_path / "settings.json.bk").read_text(encoding="utf-8") == original
+    assert not (tmp_path / "settings.json.tmp").exists()
+
+
+def test_flush_from_another_thread_cancels_pending_save(tmp_path, monkeypatch):
+    manager, writes = make_manager(tmp_path, monkeypatch)
+
+    async def scenario():
+        manager.set_setting("font_size", 30)
+        # Like the restart/shutdown endpoints, which flush from their own thread
+        await asyncio.to_thread(manager.flush)
+        await asyncio.sleep(0.1)
+
+    asyncio.run(scenario())
+    assert len(writes) == 1
+    data = json.loads((tmp_path / "settings.json").read_text(encoding="utf-8"))
+    assert data["ui_settings"]["font_size"] == 30
+
+
+def test_scheduled_save_writes_off_the_event_loop(tmp_path, monkeypatch):
+    import threading
+
+    manager, _ = make_manager(tmp_path, monkeypatch)
+    threads = []
+    save = manager.save_settings
+    monkeypatch.setattr(manager, "save_settings", lambda *a: (threads.append(threading.current_thread()), save(*a)))
+
+    async def scenario():
+        manager.set_setting("font_size", 14)
+        await asyncio.sleep(0.1)
+
+    asyncio.run(scenario())
+    assert len(threads) == 1
+    assert threads[0] is not threading.main_thread()
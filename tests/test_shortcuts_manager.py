@@ -0,0 +1,81 @@
+import asyncio
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from server import Shortcut, ShortcutsManager, build_command, build_command_list
+
+
+def test_crud_keeps_order_and_persists(tmp_path):
+    data_file = tmp_path / "shortcuts.json"
+    manager = ShortcutsManager(str(data_file))
+
+    a = manager.add(Shortcut(name="a", path="/a"))
+    b = manager.add(Shortcut(name="b", path="/b"))
+    c = manager.add(Shortcut(name="c", path="/c"))
+    assert manager.get(b.id).path == "/b"
+    assert manager.get("missing") is None
+
+    updated = manager.update(a.id, {"name": "A", "id": "ignored"})
+    assert updated.id == a.id
+    assert manager.update("missing", {"name": "x"}) is None
+    manager.delete(b.id)
+
+    reloaded = ShortcutsManager(str(data_file))
+    assert [(s.id, s.name) for s in reloaded.list()] == [(a.id, "A"), (c.id, "c")]
+
+
+def test_load_assigns_missing_ids(tmp_path):
+    data_file = tmp_path / "shortcuts.json"
+    data_file.write_text('{"shortcuts": [{"name": "x", "path": "/x"}]}', encoding="utf-8")
+
+    manager = ShortcutsManager(str(data_file))
+    [s] = manager.list()
+    assert s.id
+    assert manager.get(s.id) is s
+
+
+def test_saves_are_coalesced_off_the_request_path(tmp_path):
+    data_file = tmp_path / "shortcuts.json"
+    manager = ShortcutsManager(str(data_file), save_delay=0.05)
+    writes = []
+    original = manager._write
+    manager._write = lambda data: (writes.append(data), original(data))
+
+    async def scenario():
+        for i in range(5):
+            manager.add(Shortcut(name=f"s{i}", path=f"/s{i}"))
+        # Nothing is written synchronously by the mutations
+        assert writes == []
+        await asyncio.sleep(0.2)
+
+    asyncio.run(scenario())
+
+    assert len(writes) == 1
+    assert [s.name for s in ShortcutsManager(str(data_file)).list()] == [f"s{i}" for i in range(5)]
+    assert not (tmp_path / "shortcuts.json.tmp").exists()
+
+
+def test_flush_writes_pending_changes(tmp_path):
+    data_file = tmp_path / "shortcuts.json"
+    manager = ShortcutsManager(str(data_file), save_delay=60)
+
+    async def scenario():
+        manager.add(Shortcut(name="x", path="/x"))
+        await manager.flush()
+
+    asyncio.run(scenario())
+    assert [s.name for s in ShortcutsManager(str(data_file)).list()] == ["x"]
+
+
+def test_build_command_prefixes_match_launch_target():
+    bat = Shortcut(name="b", path="run.bat", args="x")
+    assert build_command(bat) == "run.bat x"
+    assert build_command_list(bat) == ["cmd.exe", "/c", "run.bat", "x"]
+
+    py = Shortcut(name="p", path="my script.py")
+    assert build_command(py) == 'python "my script.py"'
+    assert build_command_list(py) == [sys.executable, "my script.py"]
+
+    ps1 = Shortcut(name="s", path="go.ps1")
+    assert build_command(ps1) == "powershell -ExecutionPolicy Bypass -File go.ps1"
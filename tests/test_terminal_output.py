@@ -0,0 +1,157 @@
+import asyncio
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+import server
+
+
+class FakeSocket:
+    def __init__(self, fail=False, delay=0, block=False):
+        self.frames = []
+        self.fail = fail
+        self.delay = delay
+        self.block = block
+        self.closed_with = None
+
+    async def send_bytes(self, data):
+        if self.block:
+            await asyncio.Event().wait()
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("socket closed")
+        self.frames.append(data)
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+class FakeSession(server._TerminalOutput):
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.history = bytearray()
+        self.subscribers = ()
+        self._start_output()
+
+
+async def finish(session):
+    session._stop_output()
+    await session.sender_task
+    await asyncio.gather(*(s.task for s in session.subscribers), return_exceptions=True)
+
+
+def test_slow_socket_does_not_delay_others_and_failed_sockets_are_dropped():
+    async def scenario():
+        session = FakeSession()
+        fast = FakeSocket()
+        slow = FakeSocket(delay=0.3)
+        broken = FakeSocket(fail=True)
+        for ws in (fast, slow, broken):
+            session.subscribe(ws)
+
+        session._emit_output("hello")
+        await asyncio.sleep(0.1)
+        fast_frames = list(fast.frames)
+        await finish(session)
+        return session, fast, fast_frames, slow
+
+    session, fast, fast_frames, slow = asyncio.run(scenario())
+    assert fast_frames == [server._output_frame("hello")]
+    assert slow.frames == [server._output_frame("hello")]
+    assert [s.ws for s in session.subscribers] == [fast, slow]
+
+
+def test_stalled_subscriber_is_disconnected_when_its_queue_fills(monkeypatch):
+    monkeypatch.setattr(server, "TERM_SUBSCRIBER_QUEUE", 2)
+
+    async def scenario():
+        session = FakeSession()
+        stalled = FakeSocket(block=True)
+        healthy = FakeSocket()
+        session.subscribe(stalled)
+        session.subscribe(healthy)
+        for i in range(5):
+            session._emit_output(f"chunk {i}")
+            await asyncio.sleep(0.03)
+        await asyncio.sleep(0)
+        subs = [s.ws for s in session.subscribers]
+        await finish(session)
+        return subs, stalled, healthy
+
+    subs, stalled, healthy = asyncio.run(scenario())
+    assert subs == [healthy]
+    assert stalled.closed_with == 1013
+    assert b"".join(f[1:] for f in healthy.frames) == b"".join(f"chunk {i}".encode() for i in range(5))
+
+
+def test_subscribe_replays_history_then_coalesced_bursts():
+    async def scenario():
+        session = FakeSession()
+        session._emit_output("boot\n")
+        await asyncio.sleep(0.05)
+        ws = FakeSocket()
+        session.subscribe(ws)
+        for i in range(10):
+            session._emit_output(f"line {i}\n")
+        await finish(session)
+        return session, ws
+
+    session, ws = asyncio.run(scenario())
+    burst = "".join(f"line {i}\n" for i in range(10))
+    assert ws.frames == [server._output_frame("boot\n"), server._output_frame(burst)]
+    assert session.history == ("boot\n" + burst).encode()
+
+
+def test_output_after_idle_is_sent_without_waiting(monkeypatch):
+    monkeypatch.setattr(server, "TERM_COALESCE_WINDOW", 0.5)
+
+    async def scenario():
+        session = FakeSession()
+        ws = FakeSocket()
+        session.subscribe(ws)
+        session._emit_output("a")
+        await asyncio.sleep(0.05)
+        echoed = list(ws.frames)
+        # Arrives right behind the last flush, so it waits for the window
+        session._emit_output("b")
+        await asyncio.sleep(0.05)
+        held = list(ws.frames)
+        await finish(session)
+        return echoed, held, ws.frames
+
+    echoed, held, frames = asyncio.run(scenario())
+    assert echoed == [server._output_frame("a")]
+    assert held == echoed
+    assert frames == [server._output_frame("a"), server._output_frame("b")]
+
+
+def test_history_is_trimmed_by_bytes_on_a_character_boundary(monkeypatch):
+    monkeypatch.setattr(server, "TERM_HISTORY_BYTES", 16)
+
+    async def scenario():
+        session = FakeSession()
+        for _ in range(10):
+            session._emit_output("é" * 3)
+        await finish(session)
+        return session
+
+    session = asyncio.run(scenario())
+    assert 16 <= len(session.history) <= 20
+    assert session.history.decode() == "é" * (len(session.history) // 2)
+
+
+def test_output_queued_before_subscribe_is_sent_once():
+    async def scenario():
+        session = FakeSession()
+        # Emitted and subscribed before the sender task has had a chance to run,
+        # like the banners a session writes while it is being constructed
+        session._emit_output("banner\r\n")
+        ws = FakeSocket()
+        session.subscribe(ws)
+        await finish(session)
+        return session, ws
+
+    session, ws = asyncio.run(scenario())
+    assert ws.frames == [server._output_frame("banner\r\n")]
+    assert session.history == b"banner\r\n"
@@ -5,11 +5,20 @@ import platform
 import json
 from pathlib import Path
 
+import token_generator
+
 def print_header(title):
     print("\n" + "=" * 40)
     print(f"       {title}")
     print("=" * 40 + "\n")
 
+def confirm(prompt, default=True):
+    """Asks a (Y/n) or (y/N) question; an empty answer picks the default."""
+    answer = input(prompt).strip().lower()
+    if not answer:
+        return default
+    return answer in ("y", "yes")
+
 def install_system_dependencies():
     print("--- Termux System Dependencies ---")
     print("Checking for required system packages...")
@@ -41,8 +50,7 @@ def install_python_dependencies():
     use_offline = False
     if offline_dir.exists() and offline_dir.is_dir():
         print(f"\n[!] Offline packages detected in '{offline_dir}'.")
-        off_choice = input("Install from local offline packages? (Y/n): ").strip().lower()
-        if off_choice in ['y', 'yes', '']:
+        if confirm("Install from local offline packages? (Y/n): "):
             use_offline = True
 
     # 1. Install Cython (Build dependency)
@@ -79,13 +87,12 @@ def configure_general():
     settings_path = Path("settings.json")
     data = {"settings": {}, "ui_settings": {}}
 
-    if settings_path.exists():
-        try:
-            with open(settings_path, "r", encoding="utf-8") as f:
-                loaded = json.load(f)
-                if isinstance(loaded, dict):
-                    data = loaded
-        except: pass
+    try:
+        with open(settings_path, "r", encoding="utf-8") as f:
+            loaded = json.load(f)
+            if isinstance(loaded, dict):
+                data = loaded
+    except: pass
 
     if "settings" not in data: data["settings"] = {}
 
@@ -133,8 +140,7 @@ def configure_filesystem_mode():
             p = Path(r)
             try:
                 if not p.exists():
-                    create = input(f"Directory '{r}' does not exist. Create it? (Y/n): ").strip().lower()
-                    if create in ['y', 'yes', '']:
+                    if confirm(f"Directory '{r}' does not exist. Create it? (Y/n): "):
                         p.mkdir(parents=True, exist_ok=True)
                     else:
                         print("Using default root.")
@@ -173,13 +179,12 @@ def configure_filesystem_mode():
     settings_path = Path("settings.json")
     data = {"settings": {}, "ui_settings": {}}
 
-    if settings_path.exists():
-        try:
-            with open(settings_path, "r", encoding="utf-8") as f:
-                loaded = json.load(f)
-                if isinstance(loaded, dict):
-                    data = loaded
-        except: pass
+    try:
+        with open(settings_path, "r", encoding="utf-8") as f:
+            loaded = json.load(f)
+            if isinstance(loaded, dict):
+                data = loaded
+    except: pass
 
     if "settings" not in data:
         data["settings"] = {}
@@ -203,8 +208,7 @@ def configure_auth():
 
     if token_file.exists():
         print("Admin Token: Found.")
-        choice = input("Regenerate Admin Token? (y/N): ").strip().lower()
-        if choice in ['y', 'yes']:
+        if confirm("Regenerate Admin Token? (y/N): ", default=False):
              run_token_gen()
     else:
         print("Admin Token: Not Found.")
@@ -213,7 +217,8 @@ def configure_auth():
 
 def run_token_gen():
     try:
-        subprocess.check_call([sys.executable, "token_generator.py"])
+        # Stdlib-only, so it runs in-process instead of starting another interpreter
+        token_generator.main()
     except Exception as e:
         print(f"Error generating token: {e}")
 
@@ -221,15 +226,13 @@ def configure_port():
     print("\n--- Server Port ---")
     current_port = "8050"
     port_file = Path("port.txt")
-    if port_file.exists():
-        try:
-            current_port = port_file.read_text().strip()
-        except:
-            pass
+    try:
+        current_port = port_file.read_text().strip()
+    except OSError:
+        pass
 
     print(f"Current Port: {current_port}")
-    choice = input(f"Change Port? (current: {current_port}) (y/N): ").strip().lower()
-    if choice in ['y', 'yes']:
+    if confirm(f"Change Port? (current: {current_port}) (y/N): ", default=False):
         new_port = input("Enter new port number: ").strip()
         if new_port.isdigit():
             try:
@@ -244,8 +247,7 @@ def configure_port():
 
 def start_server():
     print("\n--- Launch ---")
-    choice = input("Start RemoDash Server now? (Y/n): ").strip().lower()
-    if choice in ['y', 'yes', '']:
+    if confirm("Start RemoDash Server now? (Y/n): "):
         print("\nStarting Server...")
         try:
             subprocess.run([sys.executable, "server.py"])
@@ -260,8 +262,7 @@ def main():
     if not install_system_dependencies():
         print("System dependency installation failed. Some python packages may fail to build.")
         # Continue anyway? No, probably should stop or ask.
-        cont = input("Continue anyway? (y/N): ").strip().lower()
-        if cont not in ['y', 'yes']:
+        if not confirm("Continue anyway? (y/N): ", default=False):
             return
 
     if not install_python_dependencies():
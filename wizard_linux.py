@@ -7,28 +7,39 @@ import time
 import shutil
 import re
 import getpass
+import hashlib
 from pathlib import Path
 
+import token_generator
+
 # --- Global State ---
 venv_python = sys.executable
+SYSTEM = platform.system()
+STARTUP_DIR = os.path.expandvars(r'%APPDATA%\Microsoft\Windows\Start Menu\Programs\Startup') if SYSTEM == "Windows" else None
 
 def print_header(title):
     print("\n" + "=" * 60)
     print(f"       {title}")
     print("=" * 60 + "\n")
 
+def confirm(prompt, default=True):
+    """Asks a (Y/n) or (y/N) question; an empty answer picks the default."""
+    answer = input(prompt).strip().lower()
+    if not answer:
+        return default
+    return answer in ("y", "yes")
+
 def save_wizard_state(key, value):
     """Saves a key-value pair to settings.json under 'wizard_state'."""
     settings_path = Path("settings.json")
     data = {"settings": {}, "ui_settings": {}, "wizard_state": {}}
 
-    if settings_path.exists():
-        try:
-            with open(settings_path, "r", encoding="utf-8") as f:
-                loaded = json.load(f)
-                if isinstance(loaded, dict):
-                    data = loaded
-        except: pass
+    try:
+        with open(settings_path, "r", encoding="utf-8") as f:
+            loaded = json.load(f)
+            if isinstance(loaded, dict):
+                data = loaded
+    except: pass
 
     if "wizard_state" not in data:
         data["wizard_state"] = {}
@@ -41,14 +52,28 @@ def save_wizard_state(key, value):
 def load_wizard_state(key, default=None):
     """Loads a value from settings.json 'wizard_state'."""
     settings_path = Path("settings.json")
-    if settings_path.exists():
-        try:
-            with open(settings_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                return data.get("wizard_state", {}).get(key, default)
-        except: pass
+    try:
+        with open(settings_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+            return data.get("wizard_state", {}).get(key, default)
+    except: pass
     return default
 
+def venv_bins(venv_path):
+    """Returns (python, pip) inside a venv for the current platform."""
+    if SYSTEM == "Windows":
+        return venv_path / "Scripts" / "python.exe", venv_path / "Scripts" / "pip.exe"
+    return venv_path / "bin" / "python", venv_path / "bin" / "pip"
+
+def requirements_fingerprint(python_path, offline):
+    """Identifies requirements.txt as installed into a given interpreter from a given source."""
+    try:
+        data = Path("requirements.txt").read_bytes()
+    except OSError:
+        return None
+    source = b"offline" if offline else b"online"
+    return hashlib.sha256(data + os.path.abspath(python_path).encode() + source).hexdigest()[:16]
+
 def install_dependencies():
     print_header("Dependencies")
 
@@ -61,20 +86,17 @@ def install_dependencies():
 
     if not in_venv:
         print("You are not running in a virtual environment.")
-        v_choice = input("Would you like to create/use a local virtual environment (venv)? (Y/n): ").strip().lower()
-        if v_choice in ['y', 'yes', '']:
+        if confirm("Would you like to create/use a local virtual environment (venv)? (Y/n): "):
             use_venv = True
         else:
             # If they decline venv, ask about break-system-packages (mostly for Linux/PEP 668)
-            bs_choice = input("Install globally? This may require '--break-system-packages' on some systems. Proceed? (Y/n): ").strip().lower()
-            if bs_choice in ['y', 'yes', '']:
+            if confirm("Install globally? This may require '--break-system-packages' on some systems. Proceed? (Y/n): "):
                 break_system = True
             else:
                 print("Aborting dependency installation.")
                 return False
 
-    choice = input("Install/Update Dependencies now? (Y/n): ").strip().lower()
-    if choice in ['y', 'yes', '']:
+    if confirm("Install/Update Dependencies now? (Y/n): "):
         print("\nInstalling dependencies...")
 
         # Check for offline packages
@@ -82,17 +104,18 @@ def install_dependencies():
         use_offline = False
         if offline_dir.exists() and offline_dir.is_dir():
             print(f"\n[!] Offline packages detected in '{offline_dir}'.")
-            off_choice = input("Install from local offline packages? (Y/n): ").strip().lower()
-            if off_choice in ['y', 'yes', '']:
+            if confirm("Install from local offline packages? (Y/n): "):
                 use_offline = True
 
         pip_cmd = [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"]
+        new_venv = False
 
         if use_venv:
             # Create venv if not exists
             venv_path = Path("venv")
             if not venv_path.exists():
                 print("Creating virtual environment...")
+                new_venv = True
                 try:
                     subprocess.check_call([sys.executable, "-m", "venv", "venv"])
                 except subprocess.CalledProcessError:
@@ -100,17 +123,13 @@ def install_dependencies():
                     return False
 
             # Adjust pip command to use venv
-            if platform.system() == "Windows":
-                pip_exe = venv_path / "Scripts" / "pip.exe"
-                python_exe = venv_path / "Scripts" / "python.exe"
-            else:
-                pip_exe = venv_path / "bin" / "pip"
-                python_exe = venv_path / "bin" / "python"
+            python_exe, pip_exe = venv_bins(venv_path)
 
             if pip_exe.exists():
                 pip_cmd = [str(pip_exe), "install", "-r", "requirements.txt"]
-                # Update sys.executable for the rest of the script/launch
-                venv_python = str(python_exe)
+                # Update sys.executable for the rest of the script/launch.
+                # Absolute so the service installer doesn't have to resolve it again.
+                venv_python = os.path.abspath(python_exe)
             else:
                 print("Error: venv created but pip not found.")
                 return False
@@ -118,11 +137,35 @@ def install_dependencies():
         elif break_system:
             pip_cmd.append("--break-system-packages")
 
+        # An existing venv that already has this exact requirements.txt can skip pip entirely.
+        # Global installs always run: other tools may have changed those packages.
+        target = venv_python if use_venv else sys.executable
+        fingerprint = requirements_fingerprint(target, use_offline) if use_venv else None
+        if (fingerprint and not new_venv and fingerprint == load_wizard_state("deps_fingerprint")
+                and not confirm("requirements.txt hasn't changed since the last install. Reinstall anyway? (y/N): ", default=False)):
+            print("Dependencies are up to date.")
+            input("\nPress Enter to return to menu...")
+            return True
+
+        uv = shutil.which("uv")
+        if uv:
+            # uv resolves and downloads in parallel and takes the same flags; pip stays the fallback
+            pip_cmd = [uv, "pip", "install", "--python", target] + pip_cmd[pip_cmd.index("install") + 1:]
+        elif use_venv:
+            # Bytecode is compiled after the install on all cores instead of file by file
+            pip_cmd.append("--no-compile")
+
         if use_offline:
             pip_cmd.extend(["--no-index", f"--find-links={offline_dir}"])
 
         try:
             subprocess.check_call(pip_cmd)
+            if use_venv:
+                # Also covers uv, which doesn't compile bytecode by default. Best effort:
+                # the .pyc files are only a startup speedup.
+                subprocess.call([venv_python, "-m", "compileall", "-qq", "-j", "0", str(venv_path)])
+            if fingerprint:
+                save_wizard_state("deps_fingerprint", fingerprint)
             print("Dependencies installed successfully.")
         except subprocess.CalledProcessError:
             print("Error installing dependencies.")
@@ -140,13 +183,12 @@ def configure_general():
     settings_path = Path("settings.json")
     data = {"settings": {}, "ui_settings": {}}
 
-    if settings_path.exists():
-        try:
-            with open(settings_path, "r", encoding="utf-8") as f:
-                loaded = json.load(f)
-                if isinstance(loaded, dict):
-                    data = loaded
-        except: pass
+    try:
+        with open(settings_path, "r", encoding="utf-8") as f:
+            loaded = json.load(f)
+            if isinstance(loaded, dict):
+                data = loaded
+    except: pass
 
     if "settings" not in data: data["settings"] = {}
 
@@ -200,8 +242,7 @@ def configure_filesystem_mode():
             p = Path(r)
             try:
                 if not p.exists():
-                    create = input(f"Directory '{r}' does not exist. Create it? (Y/n): ").strip().lower()
-                    if create in ['y', 'yes', '']:
+                    if confirm(f"Directory '{r}' does not exist. Create it? (Y/n): "):
                         p.mkdir(parents=True, exist_ok=True)
                     else:
                         print("Please enter a valid directory.")
@@ -227,8 +268,9 @@ def configure_filesystem_mode():
             p_extra = Path(extra)
             try:
                 if p_extra.exists() and p_extra.is_dir():
-                    extra_roots.append(str(p_extra.resolve()))
-                    print(f"Added: {p_extra.resolve()}")
+                    resolved = str(p_extra.resolve())
+                    extra_roots.append(resolved)
+                    print(f"Added: {resolved}")
                 else:
                     print("Path does not exist or is not a directory. Skipping.")
             except Exception as e:
@@ -238,13 +280,12 @@ def configure_filesystem_mode():
     settings_path = Path("settings.json")
     data = {"settings": {}, "ui_settings": {}}
 
-    if settings_path.exists():
-        try:
-            with open(settings_path, "r", encoding="utf-8") as f:
-                loaded = json.load(f)
-                if isinstance(loaded, dict):
-                    data = loaded
-        except: pass
+    try:
+        with open(settings_path, "r", encoding="utf-8") as f:
+            loaded = json.load(f)
+            if isinstance(loaded, dict):
+                data = loaded
+    except: pass
 
     if "settings" not in data:
         data["settings"] = {}
@@ -266,18 +307,23 @@ def configure_filesystem_mode():
 
 def configure_tailscale():
     print_header("Tailscale (Remote Access)")
-    if platform.system() != "Linux":
+    if SYSTEM != "Linux":
         print("Note: Automated Tailscale installation is only supported on Linux.")
         return
 
-    choice = input("Install Tailscale? (y/N): ").strip().lower()
-    if choice in ['y', 'yes']:
+    if confirm("Install Tailscale? (y/N): ", default=False):
         print("Installing Tailscale...")
         try:
-            # Using the official install script for better compatibility
-            subprocess.check_call("curl -fsSL https://tailscale.com/install.sh | sh", shell=True)
+            # Using the official install script for better compatibility.
+            # Downloaded in full before sh runs it, so a dropped connection can't
+            # execute half a script and a curl failure isn't masked by sh's exit code.
+            script = subprocess.run(
+                ["curl", "-fsSL", "https://tailscale.com/install.sh"],
+                stdout=subprocess.PIPE, check=True
+            ).stdout
+            subprocess.run(["sh"], input=script, check=True)
             print("Tailscale installed. You may need to run 'sudo tailscale up' to connect.")
-        except subprocess.CalledProcessError:
+        except (subprocess.CalledProcessError, OSError):
              print("Tailscale installation failed. Please install manually.")
     else:
         print("Skipping Tailscale.")
@@ -286,30 +332,33 @@ def configure_tailscale():
 
 def configure_service():
     print_header("Service Installer")
-    choice = input("Install RemoDash as a system service/startup task? (y/N): ").strip().lower()
-    if choice not in ['y', 'yes']:
+    if not confirm("Install RemoDash as a system service/startup task? (y/N): ", default=False):
         print("Skipping service installation.")
         return
 
-    if platform.system() == "Windows":
+    if SYSTEM == "Windows":
         # Windows: Startup Folder Shortcut via VBS
         try:
-            startup_folder = os.path.expandvars(r'%APPDATA%\Microsoft\Windows\Start Menu\Programs\Startup')
+            startup_folder = STARTUP_DIR
             if not os.path.exists(startup_folder):
                 print(f"Error: Startup folder not found at {startup_folder}")
                 return
 
             # Ensure we have a .bat file to launch
-            bat_path = Path("start_remodash.bat").resolve()
+            cwd = Path.cwd().resolve()
+            bat_path = cwd / "start_remodash.bat"
             with open(bat_path, "w") as f:
-                f.write(f'@echo off\ncd /d "{os.getcwd()}"\n"{venv_python}" server.py\n')
+                f.write(f'@echo off\ncd /d "{cwd}"\n"{venv_python}" server.py\n')
 
             # Create VBS script in startup to launch invisible
             vbs_path = os.path.join(startup_folder, "RemoDash.vbs")
+            vbs_content = (
+                'Set WshShell = CreateObject("WScript.Shell")\n'
+                f'WshShell.Run chr(34) & "{bat_path}" & chr(34), 0\n'
+                'Set WshShell = Nothing\n'
+            )
             with open(vbs_path, "w") as f:
-                f.write('Set WshShell = CreateObject("WScript.Shell")\n')
-                f.write(f'WshShell.Run chr(34) & "{bat_path}" & chr(34), 0\n')
-                f.write('Set WshShell = Nothing\n')
+                f.write(vbs_content)
 
             print(f"Created startup entry: {vbs_path}")
             print("RemoDash will start automatically on login.")
@@ -317,7 +366,7 @@ def configure_service():
         except Exception as e:
             print(f"Error installing service: {e}")
 
-    elif platform.system() == "Linux":
+    elif SYSTEM == "Linux":
         # Linux: systemd service
         if os.geteuid() != 0:
             print("Error: You must run this script with sudo to install a systemd service.")
@@ -329,9 +378,11 @@ def configure_service():
             if not user or user == 'root':
                 user = input("Enter username to run service as: ").strip()
 
-            cwd = str(Path.cwd().resolve())
-            python_path = str(Path(venv_python).resolve())
-            server_script = str(Path("server.py").resolve())
+            cwd = Path.cwd().resolve()
+            # abspath, not resolve(): following the venv's python symlink would
+            # start the service on the system interpreter without the venv packages
+            python_path = os.path.abspath(venv_python)
+            server_script = cwd / "server.py"
 
             service_content = f"""[Unit]
 Description=RemoDash Server
@@ -358,8 +409,7 @@ WantedBy=multi-user.target
             print("Enabling service...")
             subprocess.check_call(["systemctl", "enable", "remodash"])
 
-            choice = input("Start service now? (Y/n): ").strip().lower()
-            if choice in ['y', 'yes', '']:
+            if confirm("Start service now? (Y/n): "):
                 subprocess.check_call(["systemctl", "start", "remodash"])
                 print("Service started.")
 
@@ -372,15 +422,13 @@ def configure_port():
     print_header("Server Port")
     current_port = "8240"
     port_file = Path("port.txt")
-    if port_file.exists():
-        try:
-            current_port = port_file.read_text().strip()
-        except:
-            pass
+    try:
+        current_port = port_file.read_text().strip()
+    except OSError:
+        pass
 
     print(f"Current Port: {current_port}")
-    choice = input(f"Change Port? (current: {current_port}) (y/N): ").strip().lower()
-    if choice in ['y', 'yes']:
+    if confirm(f"Change Port? (current: {current_port}) (y/N): ", default=False):
         new_port = input("Enter new port number: ").strip()
         if new_port.isdigit():
             try:
@@ -401,13 +449,11 @@ def configure_auth():
 
     if token_file.exists():
         print("Admin Token: Found.")
-        choice = input("Regenerate Admin Token? (y/N): ").strip().lower()
-        if choice in ['y', 'yes']:
+        if confirm("Regenerate Admin Token? (y/N): ", default=False):
              run_token_gen()
     else:
         print("Admin Token: Not Found.")
-        choice = input("Generate Admin Token? (Y/n): ").strip().lower()
-        if choice in ['y', 'yes', '']:
+        if confirm("Generate Admin Token? (Y/n): "):
             run_token_gen()
         else:
             print("WARNING: No admin token generated. You may not be able to log in unless No-Auth mode is enabled.")
@@ -416,7 +462,8 @@ def configure_auth():
 
 def run_token_gen():
     try:
-        subprocess.check_call([venv_python, "token_generator.py"])
+        # Stdlib-only, so it runs in-process instead of starting another interpreter
+        token_generator.main()
     except Exception as e:
         print(f"Error generating token: {e}")
 
@@ -839,8 +886,7 @@ def run_diagnostics():
 
     print("\nDiagnostics complete.")
 
-    save = input("Save to 'diagnostics.txt'? (Y/n): ").strip().lower()
-    if save in ['y', 'yes', '']:
+    if confirm("Save to 'diagnostics.txt'? (Y/n): "):
         try:
             with open("diagnostics.txt", "w") as f:
                 f.write("\n".join(output_log))
@@ -852,8 +898,7 @@ def run_diagnostics():
 
 def start_server():
     print_header("Launch Server")
-    choice = input("Start RemoDash Server now? (Y/n): ").strip().lower()
-    if choice in ['y', 'yes', '']:
+    if confirm("Start RemoDash Server now? (Y/n): "):
         print("\nStarting Server...")
         try:
             # Use the python executable determined during dependency install (venv or system)
@@ -3,13 +3,23 @@ import sys
 import subprocess
 import platform
 import json
+import shutil
 from pathlib import Path
 
+import token_generator
+
 def print_header(title):
     print("\n" + "=" * 40)
     print(f"       {title}")
     print("=" * 40 + "\n")
 
+def confirm(prompt, default=True):
+    """Asks a (Y/n) or (y/N) question; an empty answer picks the default."""
+    answer = input(prompt).strip().lower()
+    if not answer:
+        return default
+    return answer in ("y", "yes")
+
 def install_dependencies():
     print("--- Dependencies ---")
 
@@ -20,12 +30,10 @@ def install_dependencies():
 
     if not in_venv:
         print("You are not running in a virtual environment.")
-        v_choice = input("Would you like to create/use a local virtual environment (venv)? (Y/n): ").strip().lower()
-        if v_choice in ['y', 'yes', '']:
+        if confirm("Would you like to create/use a local virtual environment (venv)? (Y/n): "):
             use_venv = True
 
-    choice = input("Install/Update Dependencies now? (Y/n): ").strip().lower()
-    if choice in ['y', 'yes', '']:
+    if confirm("Install/Update Dependencies now? (Y/n): "):
         print("\nInstalling dependencies...")
 
         # Check for offline packages
@@ -33,8 +41,7 @@ def install_dependencies():
         use_offline = False
         if offline_dir.exists() and offline_dir.is_dir():
             print(f"\n[!] Offline packages detected in '{offline_dir}'.")
-            off_choice = input("Install from local offline packages? (Y/n): ").strip().lower()
-            if off_choice in ['y', 'yes', '']:
+            if confirm("Install from local offline packages? (Y/n): "):
                 use_offline = True
 
         pip_cmd = [sys.executable, "-m", "pip", "install", "-r", "requirements.txt"]
@@ -63,11 +70,24 @@ def install_dependencies():
                 print("Error: venv created but pip not found.")
                 return False
 
+        uv = shutil.which("uv")
+        if uv:
+            # uv resolves and downloads in parallel and takes the same flags; pip stays the fallback
+            target = venv_python if use_venv else sys.executable
+            pip_cmd = [uv, "pip", "install", "--python", target] + pip_cmd[pip_cmd.index("install") + 1:]
+        elif use_venv:
+            # Bytecode is compiled after the install on all cores instead of file by file
+            pip_cmd.append("--no-compile")
+
         if use_offline:
             pip_cmd.extend(["--no-index", f"--find-links={offline_dir}"])
 
         try:
             subprocess.check_call(pip_cmd)
+            if use_venv:
+                # Also covers uv, which doesn't compile bytecode by default. Best effort:
+                # the .pyc files are only a startup speedup.
+                subprocess.call([venv_python, "-m", "compileall", "-qq", "-j", "0", str(venv_path)])
             print("Dependencies installed successfully.")
         except subprocess.CalledProcessError:
             print("Error installing dependencies.")
@@ -77,6 +97,7 @@ def install_dependencies():
     return True
 
 venv_python = sys.executable
+STARTUP_DIR = os.path.expandvars(r'%APPDATA%\Microsoft\Windows\Start Menu\Programs\Startup')
 
 def configure_general():
     print("\n--- General Settings ---")
@@ -85,13 +106,12 @@ def configure_general():
     settings_path = Path("settings.json")
     data = {"settings": {}, "ui_settings": {}}
 
-    if settings_path.exists():
-        try:
-            with open(settings_path, "r", encoding="utf-8") as f:
-                loaded = json.load(f)
-                if isinstance(loaded, dict):
-                    data = loaded
-        except: pass
+    try:
+        with open(settings_path, "r", encoding="utf-8") as f:
+            loaded = json.load(f)
+            if isinstance(loaded, dict):
+                data = loaded
+    except: pass
 
     if "settings" not in data: data["settings"] = {}
 
@@ -143,8 +163,7 @@ def configure_filesystem_mode():
             p = Path(r)
             try:
                 if not p.exists():
-                    create = input(f"Directory '{r}' does not exist. Create it? (Y/n): ").strip().lower()
-                    if create in ['y', 'yes', '']:
+                    if confirm(f"Directory '{r}' does not exist. Create it? (Y/n): "):
                         p.mkdir(parents=True, exist_ok=True)
                     else:
                         print("Please enter a valid directory.")
@@ -170,8 +189,9 @@ def configure_filesystem_mode():
             p_extra = Path(extra)
             try:
                 if p_extra.exists() and p_extra.is_dir():
-                    extra_roots.append(str(p_extra.resolve()))
-                    print(f"Added: {p_extra.resolve()}")
+                    resolved = str(p_extra.resolve())
+                    extra_roots.append(resolved)
+                    print(f"Added: {resolved}")
                 else:
                     print("Path does not exist or is not a directory. Skipping.")
             except Exception as e:
@@ -181,13 +201,12 @@ def configure_filesystem_mode():
     settings_path = Path("settings.json")
     data = {"settings": {}, "ui_settings": {}}
 
-    if settings_path.exists():
-        try:
-            with open(settings_path, "r", encoding="utf-8") as f:
-                loaded = json.load(f)
-                if isinstance(loaded, dict):
-                    data = loaded
-        except: pass
+    try:
+        with open(settings_path, "r", encoding="utf-8") as f:
+            loaded = json.load(f)
+            if isinstance(loaded, dict):
+                data = loaded
+    except: pass
 
     if "settings" not in data:
         data["settings"] = {}
@@ -207,29 +226,32 @@ def configure_filesystem_mode():
 
 def configure_service():
     print("\n--- Service Installer ---")
-    choice = input("Install RemoDash as a startup task? (y/N): ").strip().lower()
-    if choice not in ['y', 'yes']:
+    if not confirm("Install RemoDash as a startup task? (y/N): ", default=False):
         print("Skipping service installation.")
         return
 
     # Windows: Startup Folder Shortcut via VBS
     try:
-        startup_folder = os.path.expandvars(r'%APPDATA%\Microsoft\Windows\Start Menu\Programs\Startup')
+        startup_folder = STARTUP_DIR
         if not os.path.exists(startup_folder):
             print(f"Error: Startup folder not found at {startup_folder}")
             return
 
         # Ensure we have a .bat file to launch
-        bat_path = Path("start_remodash.bat").resolve()
+        cwd = Path.cwd().resolve()
+        bat_path = cwd / "start_remodash.bat"
         with open(bat_path, "w") as f:
-            f.write(f'@echo off\ncd /d "{os.getcwd()}"\n"{venv_python}" server.py\n')
+            f.write(f'@echo off\ncd /d "{cwd}"\n"{venv_python}" server.py\n')
 
         # Create VBS script in startup to launch invisible
         vbs_path = os.path.join(startup_folder, "RemoDash.vbs")
+        vbs_content = (
+            'Set WshShell = CreateObject("WScript.Shell")\n'
+            f'WshShell.Run chr(34) & "{bat_path}" & chr(34), 0\n'
+            'Set WshShell = Nothing\n'
+        )
         with open(vbs_path, "w") as f:
-            f.write('Set WshShell = CreateObject("WScript.Shell")\n')
-            f.write(f'WshShell.Run chr(34) & "{bat_path}" & chr(34), 0\n')
-            f.write('Set WshShell = Nothing\n')
+            f.write(vbs_content)
 
         print(f"Created startup entry: {vbs_path}")
         print("RemoDash will start automatically on login.")
@@ -241,15 +263,13 @@ def configure_port():
     print("\n--- Server Port ---")
     current_port = "8240"
     port_file = Path("port.txt")
-    if port_file.exists():
-        try:
-            current_port = port_file.read_text().strip()
-        except:
-            pass
+    try:
+        current_port = port_file.read_text().strip()
+    except OSError:
+        pass
 
     print(f"Current Port: {current_port}")
-    choice = input(f"Change Port? (current: {current_port}) (y/N): ").strip().lower()
-    if choice in ['y', 'yes']:
+    if confirm(f"Change Port? (current: {current_port}) (y/N): ", default=False):
         new_port = input("Enter new port number: ").strip()
         if new_port.isdigit():
             try:
@@ -268,27 +288,25 @@ def configure_auth():
 
     if token_file.exists():
         print("Admin Token: Found.")
-        choice = input("Regenerate Admin Token? (y/N): ").strip().lower()
-        if choice in ['y', 'yes']:
+        if confirm("Regenerate Admin Token? (y/N): ", default=False):
              run_token_gen()
     else:
         print("Admin Token: Not Found.")
-        choice = input("Generate Admin Token? (Y/n): ").strip().lower()
-        if choice in ['y', 'yes', '']:
+        if confirm("Generate Admin Token? (Y/n): "):
             run_token_gen()
         else:
             print("WARNING: No admin token generated. You may not be able to log in unless No-Auth mode is enabled.")
 
 def run_token_gen():
     try:
-        subprocess.check_call([venv_python, "token_generator.py"])
+        # Stdlib-only, so it runs in-process instead of starting another interpreter
+        token_generator.main()
     except Exception as e:
         print(f"Error generating token: {e}")
 
 def start_server():
     print("\n--- Launch ---")
-    choice = input("Start RemoDash Server now? (Y/n): ").strip().lower()
-    if choice in ['y', 'yes', '']:
+    if confirm("Start RemoDash Server now? (Y/n): "):
         print("\nStarting Server...")
         try:
             # Use the python executable determined during dependency install (venv or system)